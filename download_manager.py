@@ -1,18 +1,53 @@
 from enum import Enum
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple, Sequence, NamedTuple
 from datetime import datetime, timedelta
-from threading import Thread, RLock, Event
+from threading import Thread, Lock, RLock, Event, Condition, local
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+import heapq
+from collections import defaultdict
 import time
 import uuid
 import os
 import hashlib
+import mmap
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse
+from urllib.request import url2pathname
 from pathlib import Path
 import json
 
 
+# Minimum seconds between progress wake-ups sent to a task's monitor
+PROGRESS_NOTIFY_INTERVAL = 0.2
+
+# Minimum seconds between on_progress callbacks (the final 100% is always sent)
+PROGRESS_CALLBACK_INTERVAL = 0.1
+
+# Bytes pulled from the socket per loop iteration (pause/cancel checked once per block)
+READ_BLOCK_SIZE = 1024 * 1024
+
+# Multiply by this instead of dividing by 1024 * 1024
+MB_PER_BYTE = 1.0 / (1024 * 1024)
+
+# Progress a task must make before to_dict() re-formats its cached snapshot
+DICT_CACHE_BYTES_THRESHOLD = 64 * 1024
+
+# Adaptive connection count: a target chunk size of BDP_CHUNK_MULTIPLIER x the
+# bandwidth-delay product (bandwidth timed over the first PROBE_SIZE bytes, RTT
+# from the HEAD request), clamped to [MIN_CHUNK_SIZE, MAX_CHUNK_SIZE], caps how
+# many connections a file uses; the file is still split evenly across them
+PROBE_SIZE = 1024 * 1024
+MIN_CHUNK_SIZE = 1024 * 1024
+MAX_CHUNK_SIZE = 16 * 1024 * 1024
+BDP_CHUNK_MULTIPLIER = 4
+
+# Checksum algorithms _verify_checksum understands (others skip verification)
+VERIFIED_ALGORITHMS = ("md5", "sha256")
+
+
 # ==================== Enums ====================
 
 class DownloadStatus(Enum):
@@ -48,6 +83,7 @@ class Protocol(Enum):
     HTTP = "http"
     HTTPS = "https"
     FTP = "ftp"
+    FILE = "file"
 
 
 # ==================== Models ====================
@@ -55,7 +91,13 @@ class Protocol(Enum):
 class DownloadChunk:
     """Represents a chunk of the file being downloaded"""
     
-    def __init__(self, chunk_id: int, start_byte: int, end_byte: int):
+    # Large downloads create many chunks; skip the per-instance __dict__
+    __slots__ = ('_chunk_id', '_start_byte', '_end_byte', '_status',
+                 '_downloaded_bytes', '_retry_count', '_max_retries', '_lock',
+                 '_hash_algorithm', '_hasher')
+    
+    def __init__(self, chunk_id: int, start_byte: int, end_byte: int,
+                 hash_algorithm: Optional[str] = None):
         self._chunk_id = chunk_id
         self._start_byte = start_byte
         self._end_byte = end_byte
@@ -63,7 +105,11 @@ class DownloadChunk:
         self._downloaded_bytes = 0
         self._retry_count = 0
         self._max_retries = 3
-        self._lock = RLock()
+        self._lock = Lock()  # Only guards increment_retry, never re-entered
+        
+        # Digest fed on the chunk's downloader thread (single-chunk downloads only)
+        self._hash_algorithm = hash_algorithm
+        self._hasher = hashlib.new(hash_algorithm) if hash_algorithm else None
     
     def get_id(self) -> int:
         return self._chunk_id
@@ -80,16 +126,23 @@ class DownloadChunk:
     def get_status(self) -> ChunkStatus:
         return self._status
     
+    # Single attribute stores are atomic under the GIL, so the setters below
+    # take no lock; only the read-modify-write in increment_retry needs one.
+    
     def set_status(self, status: ChunkStatus) -> None:
-        with self._lock:
-            self._status = status
+        self._status = status
     
     def get_downloaded_bytes(self) -> int:
         return self._downloaded_bytes
     
     def update_progress(self, bytes_downloaded: int) -> None:
-        with self._lock:
-            self._downloaded_bytes = bytes_downloaded
+        self._downloaded_bytes = bytes_downloaded
+    
+    def resume_from(self, bytes_downloaded: int) -> None:
+        """Restore progress from an earlier run; its bytes were never hashed here"""
+        self._downloaded_bytes = bytes_downloaded
+        if bytes_downloaded:
+            self._hasher = None
     
     def increment_retry(self) -> bool:
         """Increment retry count, return True if can retry"""
@@ -103,6 +156,13 @@ class DownloadChunk:
         if total == 0:
             return 0.0
         return (self._downloaded_bytes / total) * 100
+    
+    def update_digest(self, data: bytes) -> None:
+        if self._hasher:
+            self._hasher.update(data)
+    
+    def get_digest(self) -> Optional[bytes]:
+        return self._hasher.digest() if self._hasher else None
 
 
 class DownloadMetadata:
@@ -116,6 +176,7 @@ class DownloadMetadata:
         self._supports_resume = False
         self._etag: Optional[str] = None
         self._last_modified: Optional[str] = None
+        self._rtt: Optional[float] = None  # seconds, measured on the metadata request
     
     def get_url(self) -> str:
         return self._url
@@ -141,11 +202,31 @@ class DownloadMetadata:
     def set_supports_resume(self, supports: bool) -> None:
         self._supports_resume = supports
     
+    def get_etag(self) -> Optional[str]:
+        return self._etag
+    
     def set_etag(self, etag: str) -> None:
         self._etag = etag
     
     def set_last_modified(self, last_modified: str) -> None:
         self._last_modified = last_modified
+    
+    def get_rtt(self) -> Optional[float]:
+        return self._rtt
+    
+    def set_rtt(self, rtt: float) -> None:
+        self._rtt = rtt
+
+
+class DownloadSnapshot(NamedTuple):
+    """Consistent view of a task's progress, taken under one lock acquisition"""
+    progress: float  # percent
+    downloaded: int
+    size: Optional[int]
+    speed: float  # MB/s
+    eta: Optional[timedelta]
+    filename: str
+    status: DownloadStatus
 
 
 class DownloadTask:
@@ -178,10 +259,17 @@ class DownloadTask:
         self._downloaded_bytes = 0
         self._speed = 0.0  # bytes per second
         self._eta: Optional[timedelta] = None
+        self._last_progress_notify = 0.0
+        self._last_progress_callback = 0.0
         
         # Chunks for parallel download
-        self._chunks: List[DownloadChunk] = []
-        self._chunk_size = 1024 * 1024  # 1MB default
+        # Fixed once create_chunks() runs, so it is shared without copying
+        self._chunks: Tuple[DownloadChunk, ...] = ()
+        self._chunks_by_id: Dict[int, DownloadChunk] = {}
+        # Finished-chunk tallies so the monitor never scans chunk statuses
+        self._completed_chunks = 0
+        self._failed_chunks = 0
+        self._chunk_size = MIN_CHUNK_SIZE  # Chunks are never split smaller
         
         # Error tracking
         self._error_message: Optional[str] = None
@@ -193,6 +281,12 @@ class DownloadTask:
         self._on_complete: Optional[Callable[[], None]] = None
         self._on_error: Optional[Callable[[str], None]] = None
         self._on_pause: Optional[Callable[[], None]] = None
+        # Resolved when the task reaches COMPLETED, FAILED or CANCELLED
+        self._future: Future = Future()
+        
+        # Owner hook called with (task, old, new) on every status transition
+        self._on_status_change: Optional[
+            Callable[['DownloadTask', DownloadStatus, DownloadStatus], None]] = None
         
         # Control
         self._pause_event = Event()
@@ -202,9 +296,18 @@ class DownloadTask:
         # File verification
         self._expected_checksum: Optional[str] = None
         self._checksum_algorithm = "md5"
+        # Digest of a single-stream download, so verifying needs no re-read
+        self._streamed_digest: Optional[str] = None
+        
+        # Formatted to_dict() result, dropped on status/priority/speed changes
+        self._dict_cache: Optional[Dict] = None
+        self._dict_cache_bytes = 0
+        self._dict_cache_file_size: Optional[int] = None
         
         # Thread safety
         self._lock = RLock()
+        # Signalled by chunk downloaders on progress ticks and chunk status changes
+        self._progress_cv = Condition(self._lock)
     
     def get_id(self) -> str:
         return self._task_id
@@ -226,13 +329,18 @@ class DownloadTask:
     
     def set_priority(self, priority: DownloadPriority) -> None:
         self._priority = priority
+        self._dict_cache = None
     
     def get_status(self) -> DownloadStatus:
         return self._status
     
     def set_status(self, status: DownloadStatus) -> None:
         with self._lock:
+            old_status = self._status
             self._status = status
+            self._dict_cache = None
+            if self._on_status_change and old_status != status:
+                self._on_status_change(self, old_status, status)
             
             if status == DownloadStatus.DOWNLOADING:
                 if not self._started_at:
@@ -241,6 +349,21 @@ class DownloadTask:
                 self._paused_at = datetime.now()
             elif status in [DownloadStatus.COMPLETED, DownloadStatus.FAILED, DownloadStatus.CANCELLED]:
                 self._completed_at = datetime.now()
+                self._resolve_future(status)
+    
+    def _resolve_future(self, status: DownloadStatus) -> None:
+        if self._future.done():
+            return
+        if status == DownloadStatus.COMPLETED:
+            self._future.set_result(self)
+        elif status == DownloadStatus.FAILED:
+            self._future.set_exception(Exception(self._error_message or "Download failed"))
+        else:
+            self._future.cancel()
+    
+    def get_future(self) -> Future:
+        """Future resolving to this task on completion (raises on failure, cancelled on cancel)"""
+        return self._future
     
     def get_metadata(self) -> DownloadMetadata:
         return self._metadata
@@ -249,8 +372,42 @@ class DownloadTask:
         return self._downloaded_bytes
     
     def update_downloaded_bytes(self, bytes_count: int) -> None:
+        # Plain store, atomic under the GIL (add_downloaded_bytes needs the lock)
+        self._downloaded_bytes = bytes_count
+    
+    def add_downloaded_bytes(self, delta: int) -> None:
+        """Add bytes received by a chunk, waking the monitor at most every 200ms"""
+        with self._lock:
+            self._downloaded_bytes += delta
+            now = time.monotonic()
+            if now - self._last_progress_notify >= PROGRESS_NOTIFY_INTERVAL:
+                self._last_progress_notify = now
+                self._progress_cv.notify_all()
+    
+    def record_chunk_result(self, completed: bool) -> None:
+        """Count a finished chunk and wake the monitor"""
+        with self._lock:
+            if completed:
+                self._completed_chunks += 1
+            else:
+                self._failed_chunks += 1
+            self._progress_cv.notify_all()
+    
+    def get_completed_chunk_count(self) -> int:
+        return self._completed_chunks
+    
+    def get_failed_chunk_count(self) -> int:
+        return self._failed_chunks
+    
+    def notify_progress(self) -> None:
+        """Wake the monitor immediately (chunk finished, failed or was cancelled)"""
+        with self._lock:
+            self._progress_cv.notify_all()
+    
+    def wait_for_progress(self, predicate: Callable[[], bool], timeout: float) -> bool:
+        """Block until predicate holds or timeout elapses, return predicate result"""
         with self._lock:
-            self._downloaded_bytes = bytes_count
+            return self._progress_cv.wait_for(predicate, timeout=timeout)
     
     def get_progress_percentage(self) -> float:
         """Get download progress percentage"""
@@ -265,15 +422,31 @@ class DownloadTask:
     
     def set_speed(self, speed: float) -> None:
         self._speed = speed
+        self._dict_cache = None
     
     def get_speed_mb(self) -> float:
         """Get download speed in MB/s"""
-        return self._speed / (1024 * 1024)
+        return self._speed * MB_PER_BYTE
     
     def get_eta(self) -> Optional[timedelta]:
         """Get estimated time to completion"""
         return self._eta
     
+    def snapshot(self) -> DownloadSnapshot:
+        """All the fields a progress display needs, read together"""
+        with self._lock:
+            downloaded = self._downloaded_bytes
+            file_size = self._metadata.get_file_size()
+            return DownloadSnapshot(
+                progress=(downloaded / file_size) * 100 if file_size else 0.0,
+                downloaded=downloaded,
+                size=file_size,
+                speed=self._speed * MB_PER_BYTE,
+                eta=self._eta,
+                filename=self._filename,
+                status=self._status
+            )
+    
     def calculate_eta(self) -> None:
         """Calculate ETA based on current speed"""
         file_size = self._metadata.get_file_size()
@@ -283,32 +456,56 @@ class DownloadTask:
             self._eta = timedelta(seconds=int(seconds_remaining))
         else:
             self._eta = None
+        self._dict_cache = None
     
-    def create_chunks(self) -> None:
-        """Divide file into chunks for parallel download"""
+    def get_num_connections(self) -> int:
+        return self._num_connections
+    
+    def create_chunks(self, num_chunks: Optional[int] = None) -> None:
+        """Divide file into num_chunks even chunks (default: one per connection)"""
         file_size = self._metadata.get_file_size()
         if not file_size:
             return
         
-        chunk_size = max(file_size // self._num_connections, self._chunk_size)
+        num_chunks = max(1, min(num_chunks or self._num_connections,
+                                file_size // self._chunk_size))
+        chunk_size = -(-file_size // num_chunks)
+        
+        # A lone chunk is the whole file in order, so hashing it while writing
+        # gives the file digest; several range digests cannot be combined into
+        # one, so multi-chunk downloads are hashed once by the verifier instead
+        hash_algorithm = self.get_stream_hash_algorithm() if num_chunks == 1 else None
         
-        for i in range(self._num_connections):
+        chunks = []
+        for i in range(num_chunks):
             start = i * chunk_size
-            end = start + chunk_size - 1
-            
-            if i == self._num_connections - 1:
-                end = file_size - 1
+            end = min(start + chunk_size, file_size) - 1
             
-            chunk = DownloadChunk(i, start, end)
-            self._chunks.append(chunk)
+            chunk = DownloadChunk(i, start, end, hash_algorithm)
+            chunks.append(chunk)
+            self._chunks_by_id[i] = chunk
+        self._chunks = tuple(chunks)
+        self._completed_chunks = 0
+        self._failed_chunks = 0
     
-    def get_chunks(self) -> List[DownloadChunk]:
-        return self._chunks.copy()
+    def get_chunks(self) -> Tuple[DownloadChunk, ...]:
+        """Chunks in byte order (immutable, no copy is made)"""
+        return self._chunks
     
     def get_chunk(self, chunk_id: int) -> Optional[DownloadChunk]:
-        for chunk in self._chunks:
-            if chunk.get_id() == chunk_id:
-                return chunk
+        return self._chunks_by_id.get(chunk_id)
+    
+    def get_streamed_digest(self) -> Optional[str]:
+        """Whole-file hex digest built while the body was written, if any"""
+        return self._streamed_digest
+    
+    def set_streamed_digest(self, digest: Optional[str]) -> None:
+        self._streamed_digest = digest
+    
+    def get_stream_hash_algorithm(self) -> Optional[str]:
+        """Algorithm to hash with while writing, or None if nothing will be verified"""
+        if self._expected_checksum and self._checksum_algorithm in VERIFIED_ALGORITHMS:
+            return self._checksum_algorithm
         return None
     
     def is_paused(self) -> bool:
@@ -328,10 +525,14 @@ class DownloadTask:
     def cancel(self) -> None:
         """Cancel the download"""
         self._cancel_event.set()
+        self.notify_progress()
     
     def wait_if_paused(self) -> None:
         """Block if download is paused"""
-        self._pause_event.wait()
+        # is_set() is a plain flag read; Event.wait() would take the
+        # event's internal lock even when the download is not paused
+        if not self._pause_event.is_set():
+            self._pause_event.wait()
     
     def set_expected_checksum(self, checksum: str, algorithm: str = "md5") -> None:
         """Set expected checksum for verification"""
@@ -363,9 +564,20 @@ class DownloadTask:
         """Set pause callback"""
         self._on_pause = callback
     
-    def trigger_progress(self) -> None:
-        if self._on_progress:
-            self._on_progress(self.get_progress_percentage(), self.get_speed_mb())
+    def on_status_change(self, callback: Callable[['DownloadTask', DownloadStatus,
+                                                  DownloadStatus], None]) -> None:
+        """Set status transition callback (task, old_status, new_status), run under the task lock"""
+        self._on_status_change = callback
+    
+    def trigger_progress(self, force: bool = False) -> None:
+        """Call on_progress, coalesced to one call per PROGRESS_CALLBACK_INTERVAL"""
+        if not self._on_progress:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_progress_callback < PROGRESS_CALLBACK_INTERVAL:
+            return
+        self._last_progress_callback = now
+        self._on_progress(self.get_progress_percentage(), self.get_speed_mb())
     
     def trigger_complete(self) -> None:
         if self._on_complete:
@@ -379,84 +591,179 @@ class DownloadTask:
         if self._on_pause:
             self._on_pause()
     
-    def __lt__(self, other: 'DownloadTask') -> bool:
-        """For priority queue comparison"""
-        if self._priority.value != other._priority.value:
-            return self._priority.value > other._priority.value
-        return self._created_at < other._created_at
-    
     def to_dict(self) -> Dict:
-        """Convert to dictionary"""
-        return {
-            'task_id': self._task_id,
-            'filename': self._filename,
-            'url': self._url,
-            'status': self._status.value,
-            'priority': self._priority.name,
-            'progress': f"{self.get_progress_percentage():.2f}%",
-            'downloaded': f"{self._downloaded_bytes / (1024*1024):.2f} MB",
-            'total_size': f"{self._metadata.get_file_size() / (1024*1024):.2f} MB" if self._metadata.get_file_size() else "Unknown",
-            'speed': f"{self.get_speed_mb():.2f} MB/s",
-            'eta': str(self._eta) if self._eta else "Unknown",
-            'created_at': self._created_at.isoformat()
-        }
+        """Convert to dictionary (formatted strings are cached between polls)"""
+        downloaded = self._downloaded_bytes
+        file_size = self._metadata.get_file_size()
+        cache = self._dict_cache
+        if (cache is None or file_size != self._dict_cache_file_size or
+                abs(downloaded - self._dict_cache_bytes) >= DICT_CACHE_BYTES_THRESHOLD):
+            cache = {
+                'task_id': self._task_id,
+                'filename': self._filename,
+                'url': self._url,
+                'status': self._status.value,
+                'priority': self._priority.name,
+                'progress': f"{self.get_progress_percentage():.2f}%",
+                'downloaded': f"{downloaded * MB_PER_BYTE:.2f} MB",
+                'total_size': f"{file_size * MB_PER_BYTE:.2f} MB" if file_size else "Unknown",
+                'speed': f"{self.get_speed_mb():.2f} MB/s",
+                'eta': str(self._eta) if self._eta else "Unknown",
+                'created_at': self._created_at.isoformat()
+            }
+            self._dict_cache = cache
+            self._dict_cache_bytes = downloaded
+            self._dict_cache_file_size = file_size
+        
+        return dict(cache)
 
 
 # ==================== Download Workers ====================
 
-class ChunkDownloader(Thread):
-    """Worker thread for downloading a single chunk"""
+_read_buffers = local()
+
+
+def _get_read_buffer() -> memoryview:
+    """Per-thread read buffer, reused by every chunk a pool thread downloads"""
+    buffer = getattr(_read_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _read_buffers.buffer = memoryview(bytearray(READ_BLOCK_SIZE))
+    return buffer
+
+
+def _body_readinto(response: requests.Response) -> Callable[[memoryview], int]:
+    """
+    readinto() for a streamed response body that fills the caller's buffer,
+    through urllib3's public HTTPResponse.readinto (decoding compressed bodies)
+    """
+    raw = response.raw
+    raw.decode_content = True
+    return raw.readinto
+
+
+def _release_if_drained(response: requests.Response) -> None:
+    """
+    Hand a fully-read connection back to the pool. Reads stop at the byte
+    count rather than at EOF, so urllib3 would not release it on its own.
+    """
+    if response.raw.closed:
+        response.raw.release_conn()
+
+
+class ChunkDownloader:
+    """Downloads a single chunk; run() executes on a DownloadWorker's chunk pool"""
     
-    def __init__(self, task: DownloadTask, chunk: DownloadChunk, temp_dir: str):
-        super().__init__(daemon=True)
+    def __init__(self, task: DownloadTask, chunk: DownloadChunk, fd: int,
+                 session: requests.Session,
+                 response: Optional[requests.Response] = None):
         self._task = task
         self._chunk = chunk
-        self._temp_dir = temp_dir
-        self._chunk_file = os.path.join(temp_dir, f"chunk_{chunk.get_id()}")
+        self._session = session  # Shared keep-alive connection pool
+        self._fd = fd  # Shared descriptor of the pre-sized output file
+        # Optional already-open response positioned at this chunk's first byte
+        self._response = response
     
     def run(self) -> None:
-        """Download the chunk"""
+        """Download the chunk, retrying from the first byte not yet written"""
         try:
             self._chunk.set_status(ChunkStatus.DOWNLOADING)
             
-            headers = {
-                'Range': f'bytes={self._chunk.get_start_byte()}-{self._chunk.get_end_byte()}'
-            }
-            
-            response = requests.get(
-                self._task.get_url(),
-                headers=headers,
-                stream=True,
-                timeout=30
-            )
-            
-            if response.status_code not in [200, 206]:
-                raise Exception(f"Failed to download chunk: HTTP {response.status_code}")
-            
-            # Download chunk to temp file
-            downloaded = 0
-            with open(self._chunk_file, 'wb') as f:
-                for data in response.iter_content(chunk_size=8192):
-                    # Check if cancelled
-                    if self._task.is_cancelled():
+            while True:
+                try:
+                    self._download()
+                    break
+                except Exception as e:
+                    print(f"   ❌ Chunk {self._chunk.get_id()} failed: {str(e)}")
+                    if not self._chunk.increment_retry():
                         self._chunk.set_status(ChunkStatus.FAILED)
                         return
-                    
-                    # Wait if paused
-                    self._task.wait_if_paused()
-                    
-                    f.write(data)
-                    downloaded += len(data)
-                    self._chunk.update_progress(downloaded)
             
-            self._chunk.set_status(ChunkStatus.COMPLETED)
-            
-        except Exception as e:
-            print(f"   ❌ Chunk {self._chunk.get_id()} failed: {str(e)}")
-            if self._chunk.increment_retry():
-                self._chunk.set_status(ChunkStatus.PENDING)  # Retry
+            if not self._task.is_cancelled():
+                self._chunk.set_status(ChunkStatus.COMPLETED)
+        finally:
+            status = self._chunk.get_status()
+            if status == ChunkStatus.COMPLETED:
+                self._task.record_chunk_result(True)
+            elif status == ChunkStatus.FAILED and not self._task.is_cancelled():
+                self._task.record_chunk_result(False)
             else:
+                self._task.notify_progress()
+    
+    def _download(self) -> None:
+        """One attempt: fetch whatever part of the chunk is still missing"""
+        # A handed-in response is only good for the first attempt
+        response, self._response = self._response, None
+        
+        if self._chunk.get_downloaded_bytes() >= self._chunk.get_size():
+            if response is not None:
+                response.close()
+            return  # Already on disk from an interrupted earlier run
+        
+        if response is None:
+            response = self._open_response(self._chunk.get_downloaded_bytes())
+        
+        with response:
+            self._write_body(response)
+        
+        if (not self._task.is_cancelled() and
+                self._chunk.get_downloaded_bytes() < self._chunk.get_size()):
+            raise Exception("Connection closed before the end of the chunk")
+    
+    def _open_response(self, resume_from: int) -> requests.Response:
+        start = self._chunk.get_start_byte() + resume_from
+        headers = {
+            'Range': f'bytes={start}-{self._chunk.get_end_byte()}'
+        }
+        
+        response = self._session.get(
+            self._task.get_url(),
+            headers=headers,
+            stream=True,
+            timeout=30
+        )
+        
+        # A plain 200 is the whole file, only usable if we asked from byte 0
+        if response.status_code != 206 and not (response.status_code == 200 and start == 0):
+            response.close()
+            raise Exception(f"Failed to download chunk: HTTP {response.status_code}")
+        return response
+    
+    def _write_body(self, response: requests.Response) -> None:
+        """Copy this chunk's bytes from response into the output file"""
+        # Write chunk straight into the output file at its byte offset.
+        # Each read fills a whole READ_BLOCK_SIZE block before returning,
+        # so each pwrite already batches what used to be 128 8 KiB writes.
+        # Continue after whatever an earlier attempt already wrote
+        downloaded = self._chunk.get_downloaded_bytes()
+        offset = self._chunk.get_start_byte() + downloaded
+        # Stop at the chunk boundary: the response may run on past it
+        remaining = self._chunk.get_size() - downloaded
+        # Network reads land in a reused buffer instead of a fresh bytes per block
+        buffer = _get_read_buffer()
+        readinto = _body_readinto(response)
+        while remaining > 0:
+            n = readinto(buffer[:min(remaining, READ_BLOCK_SIZE)])
+            if not n:
+                break
+            data = buffer[:n]
+            
+            # Check if cancelled
+            if self._task.is_cancelled():
                 self._chunk.set_status(ChunkStatus.FAILED)
+                return
+            
+            # Wait if paused
+            self._task.wait_if_paused()
+            
+            os.pwrite(self._fd, data, offset)
+            self._chunk.update_digest(data)
+            offset += n
+            remaining -= n
+            downloaded += n
+            self._chunk.update_progress(downloaded)
+            self._task.add_downloaded_bytes(n)
+        
+        _release_if_drained(response)
 
 
 class DownloadWorker(Thread):
@@ -468,6 +775,14 @@ class DownloadWorker(Thread):
         self._manager = manager
         self._running = True
         self._current_task: Optional[DownloadTask] = None
+        # Bytes of this worker's completed downloads; only this thread writes it
+        self._bytes_downloaded = 0
+        self._session = manager._session
+        # Chunk threads are started once and reused across parallel downloads
+        self._chunk_pool = ThreadPoolExecutor(
+            max_workers=manager._max_connections_per_download,
+            thread_name_prefix=f"chk-{worker_id}"
+        )
     
     def get_id(self) -> str:
         return self._worker_id
@@ -475,6 +790,16 @@ class DownloadWorker(Thread):
     def get_current_task(self) -> Optional[DownloadTask]:
         return self._current_task
     
+    def get_bytes_downloaded(self) -> int:
+        """Completed bytes plus whatever the current download has written so far"""
+        task = self._current_task
+        return self._bytes_downloaded + (task.get_downloaded_bytes() if task else 0)
+    
+    def get_snapshot(self) -> Tuple[str, Optional[str]]:
+        """(worker_id, current filename or None) from a single read of the current task"""
+        task = self._current_task
+        return self._worker_id, task.get_filename() if task else None
+    
     def stop(self) -> None:
         self._running = False
     
@@ -482,69 +807,132 @@ class DownloadWorker(Thread):
         """Main worker loop"""
         print(f"⬇️  Worker {self._worker_id} started")
         
-        while self._running:
-            try:
-                # Get next task
-                task = self._manager._get_next_task()
-                
-                if task:
-                    self._current_task = task
-                    self._execute_download(task)
-                    self._current_task = None
-                else:
-                    time.sleep(0.5)
+        try:
+            while self._running:
+                try:
+                    # Get next task (blocks until one is queued; the timeout
+                    # only bounds how long a stop() can go unnoticed)
+                    task = self._manager._get_next_task(timeout=1.0)
                     
-            except Exception as e:
-                print(f"❌ Worker {self._worker_id} error: {e}")
-                time.sleep(1)
+                    if task:
+                        self._current_task = task
+                        self._execute_download(task)
+                        self._current_task = None
+                        if task.get_status() == DownloadStatus.COMPLETED:
+                            self._bytes_downloaded += task.get_downloaded_bytes()
+                        
+                except Exception as e:
+                    print(f"❌ Worker {self._worker_id} error: {e}")
+                    time.sleep(1)
+        finally:
+            # Shut down here rather than in stop() so an in-flight download
+            # never submits to a pool that is already closed
+            self._chunk_pool.shutdown(wait=False)
     
     def _execute_download(self, task: DownloadTask) -> None:
         """Execute a download task"""
         try:
             print(f"⬇️  Downloading: {task.get_filename()}")
             task.set_status(DownloadStatus.DOWNLOADING)
+            os.makedirs(task.get_destination_path(), exist_ok=True)
             
-            # Fetch metadata
-            if not self._fetch_metadata(task):
-                task.set_status(DownloadStatus.FAILED)
-                task.set_error("Failed to fetch metadata")
-                task.trigger_error()
+            if urlparse(task.get_url()).scheme == Protocol.FILE.value:
+                self._download_local(task)
+            elif not self._download_remote(task):
                 return
             
-            # Create chunks if file supports resume and is large enough
-            file_size = task.get_metadata().get_file_size()
-            supports_resume = task.get_metadata().supports_resume()
-            
-            if supports_resume and file_size and file_size > 5 * 1024 * 1024:  # > 5MB
-                self._download_parallel(task)
-            else:
-                self._download_sequential(task)
-            
             # Verify download if checksum provided
             if task.get_status() == DownloadStatus.DOWNLOADING:
                 if task.get_expected_checksum():
                     task.set_status(DownloadStatus.VERIFYING)
                     if not self._verify_checksum(task):
-                        task.set_status(DownloadStatus.FAILED)
                         task.set_error("Checksum verification failed")
+                        task.set_status(DownloadStatus.FAILED)
                         task.trigger_error()
                         return
                 
+                task.trigger_progress(force=True)
                 task.set_status(DownloadStatus.COMPLETED)
                 print(f"✅ Download completed: {task.get_filename()}")
                 task.trigger_complete()
             
         except Exception as e:
-            task.set_status(DownloadStatus.FAILED)
             error_msg = f"Download failed: {str(e)}"
             task.set_error(error_msg)
+            task.set_status(DownloadStatus.FAILED)
             task.trigger_error()
             print(f"❌ {error_msg}")
     
+    def _download_remote(self, task: DownloadTask) -> bool:
+        """Download over HTTP(S); False if metadata could not be fetched"""
+        # Fetch metadata while speculatively streaming from byte 0, so the
+        # first chunk (or the whole sequential body) is already in flight
+        metadata_future = self._chunk_pool.submit(self._fetch_metadata, task)
+        first_response = self._open_first_range(task)
+        # Time the first block while the HEAD request is still in flight
+        probe, bandwidth = self._probe_bandwidth(first_response)
+        if probe is None:
+            first_response = None
+        try:
+            if not metadata_future.result():
+                task.set_error("Failed to fetch metadata")
+                task.set_status(DownloadStatus.FAILED)
+                task.trigger_error()
+                return False
+            
+            # Create chunks if file supports resume and is large enough
+            file_size = task.get_metadata().get_file_size()
+            supports_resume = task.get_metadata().supports_resume()
+            
+            if supports_resume and file_size and file_size > 5 * 1024 * 1024:  # > 5MB
+                self._download_parallel(task, first_response, probe, bandwidth)
+            else:
+                self._download_sequential(task, first_response, probe)
+            return True
+        finally:
+            if first_response is not None:
+                first_response.close()
+    
+    def _download_local(self, task: DownloadTask) -> None:
+        """Copy a file:// source in the kernel with sendfile (no user-space buffers)"""
+        source_path = url2pathname(urlparse(task.get_url()).path)
+        file_size = os.path.getsize(source_path)
+        task.get_metadata().set_file_size(file_size)
+        task.get_metadata().set_supports_resume(True)
+        
+        copied = 0
+        fd = self._open_output_file(task)
+        try:
+            with open(source_path, 'rb', buffering=0) as source:
+                while copied < file_size:
+                    if task.is_cancelled():
+                        task.set_status(DownloadStatus.CANCELLED)
+                        return
+                    task.wait_if_paused()
+                    
+                    if hasattr(os, 'sendfile'):
+                        # Writes at fd's own position, which tracks `copied`
+                        n = os.sendfile(fd, source.fileno(), copied, READ_BLOCK_SIZE)
+                    else:
+                        buffer = _get_read_buffer()
+                        n = source.readinto(buffer)
+                        os.pwrite(fd, buffer[:n], copied)
+                    if not n:
+                        break  # Source shrank while we were copying
+                    
+                    copied += n
+                    task.update_downloaded_bytes(copied)
+                    task.trigger_progress()
+            
+            os.ftruncate(fd, copied)
+        finally:
+            os.close(fd)
+    
     def _fetch_metadata(self, task: DownloadTask) -> bool:
         """Fetch file metadata using HEAD request"""
         try:
-            response = requests.head(task.get_url(), allow_redirects=True, timeout=10)
+            response = self._session.head(task.get_url(), allow_redirects=True, timeout=10)
+            task.get_metadata().set_rtt(response.elapsed.total_seconds())
             
             # Get file size
             content_length = response.headers.get('Content-Length')
@@ -575,20 +963,100 @@ class DownloadWorker(Thread):
             print(f"   ⚠️  Failed to fetch metadata: {str(e)}")
             return False
     
-    def _download_sequential(self, task: DownloadTask) -> None:
+    def _open_first_range(self, task: DownloadTask) -> Optional[requests.Response]:
+        """Start an open-ended GET from byte 0, or None if it cannot be used"""
+        try:
+            response = self._session.get(
+                task.get_url(),
+                headers={'Range': 'bytes=0-'},
+                stream=True,
+                timeout=30
+            )
+        except Exception:
+            return None
+        
+        # 206 (range honoured) and 200 (whole body) both start at byte 0
+        if response.status_code not in [200, 206]:
+            response.close()
+            return None
+        return response
+    
+    def _probe_bandwidth(self, response: Optional[requests.Response]
+                         ) -> Tuple[Optional[memoryview], float]:
+        """
+        Read up to PROBE_SIZE bytes from the byte-0 response, returning them
+        (to be written as the start of the file) and the measured bytes/second.
+        (None, 0.0) if there is no usable response.
+        """
+        if response is None:
+            return None, 0.0
+        probe = memoryview(bytearray(PROBE_SIZE))
+        try:
+            start = time.monotonic()
+            n = _body_readinto(response)(probe)
+            elapsed = time.monotonic() - start
+        except Exception:
+            response.close()
+            return None, 0.0
+        return probe[:n], n / elapsed if elapsed > 0 else 0.0
+    
+    def _plan_num_chunks(self, task: DownloadTask, bandwidth: float) -> int:
+        """
+        One chunk per connection, fewer when that many BDP-sized chunks would
+        cover the file. Only the count is lowered; create_chunks still splits
+        the file evenly, so chunks can be larger than the BDP target.
+        """
+        rtt = task.get_metadata().get_rtt()
+        if not bandwidth or not rtt:
+            return task.get_num_connections()
+        chunk_size = min(max(int(bandwidth * rtt * BDP_CHUNK_MULTIPLIER), MIN_CHUNK_SIZE),
+                         MAX_CHUNK_SIZE)
+        file_size = task.get_metadata().get_file_size() or 0
+        return min(task.get_num_connections(), -(-file_size // chunk_size))
+    
+    def _download_sequential(self, task: DownloadTask,
+                             response: Optional[requests.Response] = None,
+                             probe: Optional[memoryview] = None) -> None:
         """Download file sequentially (single connection)"""
-        response = requests.get(task.get_url(), stream=True, timeout=30)
-        response.raise_for_status()
-        
-        file_path = task.get_full_path()
-        os.makedirs(task.get_destination_path(), exist_ok=True)
+        if response is None:
+            response = self._session.get(task.get_url(), stream=True, timeout=30)
+            probe = None
+        
+        # Closing on every exit (HTTP error, cancel, exception) hands the
+        # connection back to the blocking pool
+        with response:
+            response.raise_for_status()
+            self._write_sequential(task, response, probe)
+    
+    def _write_sequential(self, task: DownloadTask, response: requests.Response,
+                          probe: Optional[memoryview]) -> None:
+        """Write the whole response body into the output file"""
+        task.set_streamed_digest(None)
+        algorithm = task.get_stream_hash_algorithm()
+        hasher = hashlib.new(algorithm) if algorithm else None
         
         downloaded = 0
         start_time = time.time()
         last_update = start_time
         
-        with open(file_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
+        buffer = _get_read_buffer()
+        readinto = _body_readinto(response)
+        # Same pre-sized, positioned layout as the parallel path
+        fd = self._open_output_file(task)
+        try:
+            # The probed bytes are the start of the body
+            if probe:
+                os.pwrite(fd, probe, 0)
+                if hasher:
+                    hasher.update(probe)
+                downloaded = len(probe)
+                task.update_downloaded_bytes(downloaded)
+            
+            while True:
+                n = readinto(buffer)
+                if not n:
+                    break
+                
                 # Check if cancelled
                 if task.is_cancelled():
                     task.set_status(DownloadStatus.CANCELLED)
@@ -597,71 +1065,199 @@ class DownloadWorker(Thread):
                 # Wait if paused
                 task.wait_if_paused()
                 
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    task.update_downloaded_bytes(downloaded)
-                    
-                    # Update speed and ETA every second
-                    current_time = time.time()
-                    if current_time - last_update >= 1.0:
-                        elapsed = current_time - start_time
-                        speed = downloaded / elapsed
-                        task.set_speed(speed)
-                        task.calculate_eta()
-                        task.trigger_progress()
-                        last_update = current_time
-    
-    def _download_parallel(self, task: DownloadTask) -> None:
+                os.pwrite(fd, buffer[:n], downloaded)
+                if hasher:
+                    hasher.update(buffer[:n])
+                downloaded += n
+                task.update_downloaded_bytes(downloaded)
+                
+                # Update speed and ETA every second
+                current_time = time.time()
+                if current_time - last_update >= 1.0:
+                    elapsed = current_time - start_time
+                    speed = downloaded / elapsed
+                    task.set_speed(speed)
+                    task.calculate_eta()
+                    task.trigger_progress()
+                    last_update = current_time
+            
+            # The advertised size may be missing or wrong; keep what arrived
+            os.ftruncate(fd, downloaded)
+            _release_if_drained(response)
+            if hasher:
+                task.set_streamed_digest(hasher.hexdigest())
+        finally:
+            os.close(fd)
+    
+    def _download_parallel(self, task: DownloadTask,
+                           first_response: Optional[requests.Response] = None,
+                           probe: Optional[memoryview] = None,
+                           bandwidth: float = 0.0) -> None:
         """Download file using multiple parallel connections"""
-        # Create temp directory
-        temp_dir = os.path.join(task.get_destination_path(), f".{task.get_id()}_temp")
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        # Create chunks
-        task.create_chunks()
+        # Pick up where an interrupted run left off, if its sidecar still matches;
+        # otherwise cap the chunk count by the probed bandwidth-delay product
+        saved = self._load_resume_state(task)
+        task.set_streamed_digest(None)
+        task.create_chunks(len(saved) if saved else self._plan_num_chunks(task, bandwidth))
         chunks = task.get_chunks()
         
+        if saved and self._restore_chunks(task, chunks, saved):
+            if first_response is not None:
+                # The speculative response starts at byte 0, which may already be on disk
+                first_response.close()
+                first_response = None
+            probe = None
+        elif not first_response:
+            probe = None
+        
+        # Pre-size the output file; each chunk pwrite()s into its own range
+        fd = self._open_output_file(task)
+        try:
+            if probe:
+                # Chunk 0 starts with the probed bytes (chunks are never smaller
+                # than PROBE_SIZE) and its downloader continues the same response
+                os.pwrite(fd, probe, 0)
+                chunks[0].update_digest(probe)
+                chunks[0].update_progress(len(probe))
+                task.add_downloaded_bytes(len(probe))
+            self._run_chunk_downloaders(task, chunks, fd, first_response)
+        except Exception:
+            self._save_resume_state(task, chunks)
+            raise
+        finally:
+            os.close(fd)
+        
+        if task.is_cancelled():
+            self._save_resume_state(task, chunks)
+        else:
+            self._remove_resume_state(task)
+            # A lone chunk's digest covers the whole file (None if it resumed)
+            digest = chunks[0].get_digest() if len(chunks) == 1 else None
+            task.set_streamed_digest(digest.hex() if digest else None)
+    
+    # Resume sidecar: <file>.part.json maps each chunk range to the bytes
+    # already pwrite()n there, so a restarted download only requests the gaps.
+    
+    def _resume_state_path(self, task: DownloadTask) -> str:
+        return task.get_full_path() + '.part.json'
+    
+    def _load_resume_state(self, task: DownloadTask) -> Optional[List[List[int]]]:
+        """Saved [start, end, downloaded] per chunk, if the sidecar matches this resource"""
+        if not os.path.exists(task.get_full_path()):
+            return None
+        try:
+            with open(self._resume_state_path(task)) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        metadata = task.get_metadata()
+        if (state.get('url') != task.get_url() or
+                state.get('file_size') != metadata.get_file_size() or
+                state.get('etag') != metadata.get_etag()):
+            return None
+        return state.get('chunks') or None
+    
+    def _restore_chunks(self, task: DownloadTask, chunks: Sequence[DownloadChunk],
+                        saved: List[List[int]]) -> bool:
+        """Restore chunk progress from the sidecar; True if anything was restored"""
+        # Only trust it for the same chunk layout
+        if [(start, end) for start, end, _ in saved] != [
+                (c.get_start_byte(), c.get_end_byte()) for c in chunks]:
+            return False
+        
+        restored = 0
+        for chunk, (_, _, downloaded) in zip(chunks, saved):
+            downloaded = min(downloaded, chunk.get_size())
+            if downloaded:
+                chunk.resume_from(downloaded)
+                task.add_downloaded_bytes(downloaded)
+                restored += downloaded
+        if restored:
+            print(f"   ♻️  Resuming {task.get_filename()}: {format_size(restored)} already on disk")
+        return restored > 0
+    
+    def _save_resume_state(self, task: DownloadTask,
+                           chunks: Sequence[DownloadChunk]) -> None:
+        """Record per-chunk progress; a chunk's count never covers unwritten bytes"""
+        metadata = task.get_metadata()
+        state = {
+            'url': task.get_url(),
+            'file_size': metadata.get_file_size(),
+            'etag': metadata.get_etag(),
+            'chunks': [[c.get_start_byte(), c.get_end_byte(), c.get_downloaded_bytes()]
+                       for c in chunks]
+        }
+        path = self._resume_state_path(task)
+        try:
+            # Write then rename so a crash never leaves a half-written sidecar
+            with open(path + '.tmp', 'w') as f:
+                json.dump(state, f)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            print(f"   ⚠️  Could not save resume state: {e}")
+    
+    def _remove_resume_state(self, task: DownloadTask) -> None:
+        try:
+            os.remove(self._resume_state_path(task))
+        except FileNotFoundError:
+            pass
+    
+    def _open_output_file(self, task: DownloadTask) -> int:
+        """Create the output file at its final size (if known) and return a writable fd"""
+        file_size = task.get_metadata().get_file_size() or 0
+        fd = os.open(task.get_full_path(), os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, file_size)
+            if file_size and hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(fd, 0, file_size)
+        except OSError:
+            os.close(fd)
+            raise
+        return fd
+    
+    def _run_chunk_downloaders(self, task: DownloadTask,
+                               chunks: Sequence[DownloadChunk], fd: int,
+                               first_response: Optional[requests.Response] = None) -> None:
+        """Download all chunks into fd and wait for them to finish"""
         print(f"   📦 Downloading {len(chunks)} chunks in parallel")
         
-        # Start chunk downloaders
-        downloaders = []
-        for chunk in chunks:
-            downloader = ChunkDownloader(task, chunk, temp_dir)
-            downloader.start()
-            downloaders.append(downloader)
+        # Start chunk downloaders; chunk 0 continues the speculative response
+        futures = [
+            self._chunk_pool.submit(ChunkDownloader(
+                task, chunk, fd, self._session,
+                first_response if chunk.get_start_byte() == 0 else None
+            ).run)
+            for chunk in chunks
+        ]
         
-        # Monitor progress
+        # Monitor progress; chunk downloaders wake us on progress and status changes
         start_time = time.time()
         last_update = start_time
         
-        while True:
-            # Check if all chunks completed
-            all_completed = all(c.get_status() == ChunkStatus.COMPLETED for c in chunks)
-            any_failed = any(c.get_status() == ChunkStatus.FAILED for c in chunks)
-            
-            if all_completed or any_failed or task.is_cancelled():
-                break
-            
-            # Calculate total progress
-            total_downloaded = sum(c.get_downloaded_bytes() for c in chunks)
-            task.update_downloaded_bytes(total_downloaded)
-            
-            # Update speed
+        num_chunks = len(chunks)
+        
+        def finished() -> bool:
+            return (task.is_cancelled() or
+                    task.get_failed_chunk_count() > 0 or
+                    task.get_completed_chunk_count() == num_chunks)
+        
+        while not task.wait_for_progress(finished, timeout=1.0):
+            # Update speed (chunk downloaders keep the byte total current)
             current_time = time.time()
             if current_time - last_update >= 1.0:
                 elapsed = current_time - start_time
-                speed = total_downloaded / elapsed
+                speed = task.get_downloaded_bytes() / elapsed
                 task.set_speed(speed)
                 task.calculate_eta()
                 task.trigger_progress()
+                self._save_resume_state(task, chunks)
                 last_update = current_time
-            
-            time.sleep(0.5)
+        
+        any_failed = task.get_failed_chunk_count() > 0
         
         # Wait for all downloaders to finish
-        for downloader in downloaders:
-            downloader.join()
+        wait(futures)
         
         # Check if download was successful
         if task.is_cancelled():
@@ -670,25 +1266,26 @@ class DownloadWorker(Thread):
         
         if any_failed:
             raise Exception("Some chunks failed to download")
-        
-        # Merge chunks
-        print(f"   🔗 Merging chunks...")
-        self._merge_chunks(task, temp_dir)
-        
-        # Cleanup temp files
-        import shutil
-        shutil.rmtree(temp_dir)
     
-    def _merge_chunks(self, task: DownloadTask, temp_dir: str) -> None:
-        """Merge downloaded chunks into final file"""
-        file_path = task.get_full_path()
-        os.makedirs(task.get_destination_path(), exist_ok=True)
+    def _hash_file(self, f, hasher) -> None:
+        """Feed an open file into hasher with as few Python-level calls as possible"""
+        try:
+            # One update() over the whole mapping: OpenSSL runs its SIMD/SHA-NI
+            # code with the GIL released and no copies into a Python buffer
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+            return
+        except (ValueError, OSError, OverflowError):
+            pass  # Empty file, or not mappable (e.g. too large for a 32-bit address space)
         
-        with open(file_path, 'wb') as output_file:
-            for chunk in sorted(task.get_chunks(), key=lambda c: c.get_id()):
-                chunk_file = os.path.join(temp_dir, f"chunk_{chunk.get_id()}")
-                with open(chunk_file, 'rb') as chunk_data:
-                    output_file.write(chunk_data.read())
+        # Fall back to large blocks, which still release the GIL per update
+        buffer = _get_read_buffer()
+        f.seek(0)
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            hasher.update(buffer[:n])
     
     def _verify_checksum(self, task: DownloadTask) -> bool:
         """Verify file checksum"""
@@ -696,19 +1293,17 @@ class DownloadWorker(Thread):
             algorithm = task._checksum_algorithm
             expected = task.get_expected_checksum()
             
-            if algorithm == "md5":
-                hasher = hashlib.md5()
-            elif algorithm == "sha256":
-                hasher = hashlib.sha256()
-            else:
+            if algorithm not in VERIFIED_ALGORITHMS:
                 return True  # Unknown algorithm, skip verification
             
-            file_path = task.get_full_path()
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b''):
-                    hasher.update(chunk)
-            
-            actual = hasher.hexdigest()
+            # Single-stream downloads were hashed as they were written
+            actual = task.get_streamed_digest()
+            if actual is None:
+                hasher = hashlib.new(algorithm)
+                file_path = task.get_full_path()
+                with open(file_path, 'rb', buffering=0) as f:
+                    self._hash_file(f, hasher)
+                actual = hasher.hexdigest()
             
             if actual.lower() == expected.lower():
                 print(f"   ✅ Checksum verified: {actual}")
@@ -740,20 +1335,29 @@ class DownloadManager:
         # Task storage
         self._tasks: Dict[str, DownloadTask] = {}
         
-        # Download queue (priority-based)
-        self._queue: List[DownloadTask] = []
+        # Download queue (binary heap of (-priority, created_at, task_id, task))
+        self._queue: List[Tuple[int, datetime, str, DownloadTask]] = []
         self._queue_lock = RLock()
+        # Idle workers sleep on this until a task is queued or the manager stops
+        self._queue_not_empty = Condition(self._queue_lock)
         
         # Workers
         self._workers: List[DownloadWorker] = []
         self._num_workers = num_workers
         self._max_connections_per_download = max_connections_per_download
         
+        # One keep-alive connection pool shared by every worker and chunk, so
+        # range requests reuse TCP/TLS connections instead of re-handshaking
+        self._session = self._create_session()
+        
         # Statistics
         self._total_downloads = 0
-        self._completed_downloads = 0
-        self._failed_downloads = 0
-        self._total_bytes_downloaded = 0
+        # Tasks bucketed by status (task_id -> task, insertion ordered),
+        # maintained on every transition so status queries never scan self._tasks
+        self._tasks_by_status: Dict[DownloadStatus, Dict[str, DownloadTask]] = defaultdict(dict)
+        self._status_lock = Lock()
+        # Notified on every status transition, for monitors that wait on news
+        self._status_changed = Condition(self._status_lock)
         
         # State
         self._running = False
@@ -761,6 +1365,21 @@ class DownloadManager:
         # Global lock
         self._lock = RLock()
     
+    def _create_session(self) -> requests.Session:
+        """HTTP session sized for every worker's chunks plus its metadata request"""
+        adapter = HTTPAdapter(
+            pool_connections=self._num_workers,
+            pool_maxsize=self._num_workers * (self._max_connections_per_download + 1),
+            # Wait for a pooled keep-alive connection rather than opening a
+            # throwaway one; the pool is sized for every worker's peak anyway
+            pool_block=True,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
     def start(self) -> None:
         """Start the download manager"""
         if self._running:
@@ -786,11 +1405,14 @@ class DownloadManager:
         # Stop workers
         for worker in self._workers:
             worker.stop()
+        with self._queue_not_empty:
+            self._queue_not_empty.notify_all()
         
         # Wait for workers
         for worker in self._workers:
             worker.join(timeout=5)
         
+        self._session.close()
         print("🛑 Download Manager stopped")
     
     def add_download(self, url: str, destination_path: str = "./downloads",
@@ -812,6 +1434,10 @@ class DownloadManager:
         if expected_checksum:
             task.set_expected_checksum(expected_checksum)
         
+        with self._status_lock:
+            self._tasks_by_status[task.get_status()][task_id] = task
+        task.on_status_change(self._on_task_status_change)
+        
         with self._lock:
             self._tasks[task_id] = task
             self._total_downloads += 1
@@ -820,18 +1446,35 @@ class DownloadManager:
         print(f"➕ Download added: {task.get_filename()} (Priority: {priority.name})")
         return task
     
+    def _on_task_status_change(self, task: DownloadTask, old_status: DownloadStatus,
+                               new_status: DownloadStatus) -> None:
+        """Move one task between status buckets (leaf lock, taken under the task lock)"""
+        task_id = task.get_id()
+        with self._status_lock:
+            self._tasks_by_status[old_status].pop(task_id, None)
+            self._tasks_by_status[new_status][task_id] = task
+            self._status_changed.notify_all()
+    
+    def _get_tasks_with_status(self, status: DownloadStatus) -> List[DownloadTask]:
+        with self._status_lock:
+            return list(self._tasks_by_status[status].values())
+    
     def _enqueue_task(self, task: DownloadTask) -> None:
         """Add task to queue"""
         with self._queue_lock:
             task.set_status(DownloadStatus.QUEUED)
-            self._queue.append(task)
-            self._queue.sort()  # Sort by priority
-    
-    def _get_next_task(self) -> Optional[DownloadTask]:
-        """Get next task from queue"""
-        with self._queue_lock:
+            # Highest priority first, then oldest; task_id breaks exact ties
+            heapq.heappush(self._queue, (-task.get_priority().value,
+                                         task._created_at, task.get_id(), task))
+            self._queue_not_empty.notify()
+    
+    def _get_next_task(self, timeout: float = 0) -> Optional[DownloadTask]:
+        """Get next task from queue, waiting up to timeout seconds for one to arrive"""
+        with self._queue_not_empty:
+            self._queue_not_empty.wait_for(lambda: self._queue or not self._running,
+                                           timeout=timeout)
             if self._queue:
-                return self._queue.pop(0)
+                return heapq.heappop(self._queue)[3]
         return None
     
     def pause_download(self, task_id: str) -> bool:
@@ -884,29 +1527,43 @@ class DownloadManager:
     
     def get_active_downloads(self) -> List[DownloadTask]:
         """Get currently downloading tasks"""
-        return [t for t in self._tasks.values() 
-                if t.get_status() == DownloadStatus.DOWNLOADING]
+        return self._get_tasks_with_status(DownloadStatus.DOWNLOADING)
+    
+    def get_queued_downloads(self) -> List[DownloadTask]:
+        """Get tasks waiting for a worker"""
+        return self._get_tasks_with_status(DownloadStatus.QUEUED)
+    
+    def get_paused_downloads(self) -> List[DownloadTask]:
+        """Get paused tasks"""
+        return self._get_tasks_with_status(DownloadStatus.PAUSED)
+    
+    def wait_for_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until nothing is queued, downloading or verifying; False on timeout"""
+        def idle() -> bool:
+            return (not self._tasks_by_status[DownloadStatus.DOWNLOADING] and
+                    not self._tasks_by_status[DownloadStatus.QUEUED] and
+                    not self._tasks_by_status[DownloadStatus.VERIFYING])
+        
+        with self._status_changed:
+            return self._status_changed.wait_for(idle, timeout=timeout)
     
     def get_statistics(self) -> Dict:
         """Get download statistics"""
-        active = len(self.get_active_downloads())
-        queued = sum(1 for t in self._tasks.values() if t.get_status() == DownloadStatus.QUEUED)
-        paused = sum(1 for t in self._tasks.values() if t.get_status() == DownloadStatus.PAUSED)
+        with self._status_lock:
+            counts = {status: len(tasks) for status, tasks in self._tasks_by_status.items()}
         
         return {
             'total_downloads': self._total_downloads,
-            'completed': self._completed_downloads,
-            'failed': self._failed_downloads,
-            'active': active,
-            'queued': queued,
-            'paused': paused,
-            'total_bytes_downloaded': self._total_bytes_downloaded,
+            'completed': counts.get(DownloadStatus.COMPLETED, 0),
+            'failed': counts.get(DownloadStatus.FAILED, 0),
+            'active': counts.get(DownloadStatus.DOWNLOADING, 0),
+            'queued': counts.get(DownloadStatus.QUEUED, 0),
+            'paused': counts.get(DownloadStatus.PAUSED, 0),
+            # Per-worker shards, each written only by its own worker thread
+            'total_bytes_downloaded': sum(w.get_bytes_downloaded() for w in self._workers),
             'workers': [
-                {
-                    'id': w.get_id(),
-                    'current_task': w.get_current_task().get_filename() if w.get_current_task() else None
-                }
-                for w in self._workers
+                {'id': worker_id, 'current_task': filename}
+                for worker_id, filename in (w.get_snapshot() for w in self._workers)
             ]
         }
 
@@ -920,13 +1577,16 @@ def print_section(title: str) -> None:
     print('=' * 70)
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_size(bytes_size: float) -> str:
     """Format bytes to human readable"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.2f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.2f} TB"
+    if bytes_size < 1024:
+        return f"{bytes_size:.2f} B"
+    # floor(log2(size)) // 10 is the power of 1024 to scale by
+    index = min((int(bytes_size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{bytes_size / (1 << (index * 10)):.2f} {_SIZE_UNITS[index]}"
 
 
 def demo_download_manager():
@@ -986,13 +1646,13 @@ def demo_download_manager():
             active = manager.get_active_downloads()
             if active:
                 print(f"\n   Active downloads: {len(active)}")
-                for task in active:
-                    print(f"      • {task.get_filename()}: "
-                          f"{task.get_progress_percentage():.1f}% "
-                          f"({format_size(task.get_downloaded_bytes())} / "
-                          f"{format_size(task.get_metadata().get_file_size() or 0)}) "
-                          f"@ {task.get_speed_mb():.2f} MB/s "
-                          f"ETA: {task.get_eta() or 'Unknown'}")
+                for snap in (task.snapshot() for task in active):
+                    print(f"      • {snap.filename}: "
+                          f"{snap.progress:.1f}% "
+                          f"({format_size(snap.downloaded)} / "
+                          f"{format_size(snap.size or 0)}) "
+                          f"@ {snap.speed:.2f} MB/s "
+                          f"ETA: {snap.eta or 'Unknown'}")
         
         # ==================== Pause and Resume ====================
         print_section("3. Pause and Resume")
@@ -1011,17 +1671,15 @@ def demo_download_manager():
         print_section("4. Wait for Downloads")
         
         print("\n   Waiting for downloads to complete (max 60 seconds)...")
-        max_wait = 60
-        waited = 0
+        deadline = time.monotonic() + 60
+        pending = {task.get_future() for task in tasks}
         
-        while waited < max_wait:
-            stats = manager.get_statistics()
-            if stats['active'] == 0 and stats['queued'] == 0:
-                break
-            
-            time.sleep(2)
-            waited += 2
+        # Wake when any download finishes (or every 2 seconds to print progress)
+        while pending and time.monotonic() < deadline:
+            done, pending = wait(pending, timeout=min(2, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
             
+            stats = manager.get_statistics()
             print(f"   ⏳ Active: {stats['active']}, "
                   f"Completed: {stats['completed']}, "
                   f"Failed: {stats['failed']}")
@@ -1086,7 +1744,7 @@ if __name__ == "__main__":
 # DownloadTask: Main download entity with metadata
 # DownloadChunk: Represents file segment for parallel download
 # DownloadWorker: Thread that manages downloads
-# ChunkDownloader: Thread for downloading individual chunks
+# ChunkDownloader: Job for downloading an individual chunk on the worker's thread pool
 # DownloadManager: Main orchestrator
 # 2. Key Features:
 # ✅ Multiple concurrent downloads (configurable workers) ✅ Parallel chunk downloads (multi-connection per file) ✅ Pause/Resume support (using HTTP Range header) ✅ Priority-based queue (Urgent > High > Medium > Low) ✅ Progress tracking (percentage, speed, ETA) ✅ Checksum verification (MD5, SHA256) ✅ Automatic retry (for failed chunks) ✅ Metadata fetching (file size, content type, resume support) ✅ Callbacks (progress, complete, error, pause) ✅ Thread-safe concurrent operations
@@ -1099,6 +1757,12 @@ if __name__ == "__main__":
 # File size
 # Configuration
 # 4. Chunk Management:
+# Each worker owns a fixed chunk thread pool (max_connections threads) reused across files
+# Total threads are bounded at workers x (1 + max_connections), independent of file count
+# Socket reads, 1 MiB pwrites and hashing all release the GIL, so chunk threads overlap I/O
+# Chunk count adapts to the bandwidth-delay product: the first 1 MiB is timed and
+# the file gets at most one connection per 4x BDP (1-16 MiB) of data, so small or
+# slow-RTT files use fewer connections; chunks are the file split evenly over them
 # 5. Progress Tracking:
 # Real-time speed calculation (bytes/second)
 # ETA estimation based on current speed
@@ -1106,12 +1770,18 @@ if __name__ == "__main__":
 # Callbacks for UI updates
 # 6. Pause/Resume:
 # Uses Event objects for thread synchronization
-# Preserves partial downloads in temp files
+# Chunks are written in place at their byte offsets (no merge step)
 # HTTP Range header for resuming from byte position
+# One shared requests.Session keeps connections alive across chunks and files
+# HTTP/2 multiplexing (e.g. httpx) is deliberately not used: requests/urllib3
+# speak HTTP/1.1 only, and the pool already keeps one connection per chunk
+# slot alive per origin, so handshakes are paid once per slot, not per chunk
 # 7. Error Handling:
-# Automatic chunk retry (configurable max retries)
+# Automatic chunk retry (configurable max retries), resuming from the last written byte
 # Graceful degradation (sequential if parallel fails)
 # Checksum verification for data integrity
+# Sequential and single-chunk downloads are hashed as they are written, so
+# verifying them needs no re-read; multi-chunk files are hashed once (mmap)
 # 8. Design Patterns:
 # Worker Pool: Fixed number of download workers
 # Producer-Consumer: Manager produces, workers consume
@@ -1,11 +1,44 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List, Optional, Set, Dict
-from dataclasses import dataclass
-from threading import Lock, Thread
+from typing import List, Optional, FrozenSet, Tuple, Deque, Set
+from dataclasses import dataclass, replace
+from bisect import bisect_left, bisect_right
+from collections import deque
+import heapq
+from threading import Lock, Thread, Condition
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import logging
+import queue
+import sys
 import time
 
 
+# Most hall calls assigned in one scheduler pass
+DISPATCH_BATCH_SIZE = 64
+
+# Most hall calls waiting for the scheduler; past this, callers assign their
+# own call (backpressure instead of an unbounded backlog)
+REQUEST_QUEUE_SIZE = 1024
+
+# Simulated seconds to travel one floor and to hold the doors open at a stop
+FLOOR_TRAVEL_TIME = 1.0
+DOOR_OPEN_TIME = 2.0
+
+# Controller and dispatcher messages go through a queue; a listener thread does
+# the stdout writes, so elevator movement never waits on the TTY lock
+_log_queue: queue.Queue = queue.Queue(-1)
+logger = logging.getLogger("elevator")
+logger.setLevel(logging.INFO)
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+# Started at import so messages logged before ElevatorSystem.start() are still
+# written; stopped (and flushed) at exit
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
 # ==================== Enums ====================
 
 class Direction(Enum):
@@ -15,6 +48,12 @@ class Direction(Enum):
     IDLE = "IDLE"
 
 
+# Floors moved per step in each direction; lets hot paths use int arithmetic
+# instead of enum comparisons
+_DIRECTION_STEP = {Direction.UP: 1, Direction.DOWN: -1, Direction.IDLE: 0}
+_STEP_DIRECTION = {step: direction for direction, step in _DIRECTION_STEP.items()}
+
+
 class ElevatorState(Enum):
     """Elevator operational state"""
     IDLE = "IDLE"
@@ -31,7 +70,7 @@ class RequestType(Enum):
 
 # ==================== Core Models ====================
 
-@dataclass
+@dataclass(slots=True)
 class Request:
     """Represents an elevator request"""
     floor: int
@@ -44,134 +83,194 @@ class Request:
         return f"Request(Floor {self.floor}{dir_str}, {self.request_type.value})"
 
 
+class RequestPool:
+    """Free list of Request objects, reused instead of allocating one per hall call"""
+    
+    def __init__(self, warmup: int = 0):
+        self._free: List[Request] = []
+        self.warmup(warmup)
+    
+    def warmup(self, count: int) -> None:
+        """Preallocate count requests (e.g. at startup, before the first burst)"""
+        self._free.extend(Request(0, None, RequestType.HALL_CALL, 0.0) for _ in range(count))
+    
+    def claim(self, floor: int, direction: Optional[Direction],
+              request_type: RequestType, timestamp: float) -> Request:
+        # list.pop/append are atomic under the GIL, so no lock is needed
+        try:
+            request = self._free.pop()
+        except IndexError:
+            return Request(floor, direction, request_type, timestamp)
+        request.floor = floor
+        request.direction = direction
+        request.request_type = request_type
+        request.timestamp = timestamp
+        return request
+    
+    def release(self, request: Request) -> None:
+        """Return a request once nothing references it any more"""
+        self._free.append(request)
+
+
+@dataclass(frozen=True, slots=True)
+class ElevatorSnapshot:
+    """Immutable view of an elevator's position, motion and pending targets"""
+    floor: int
+    direction: Direction
+    state: ElevatorState
+    targets: FrozenSet[int] = frozenset()
+    sorted_targets: Tuple[int, ...] = ()  # Same floors ascending, for bisect lookups
+    step: int = 0  # Direction as an int: +1 up, -1 down, 0 idle
+
+
 class Elevator:
     """Represents a single elevator"""
     
+    __slots__ = ('_id', '_min_floor', '_max_floor', '_snapshot', '_lock')
+    
     def __init__(self, elevator_id: int, min_floor: int, max_floor: int):
+        # Id and floor range never change after construction; read without locking
         self._id = elevator_id
         self._min_floor = min_floor
         self._max_floor = max_floor
-        self._current_floor = 1
-        self._direction = Direction.IDLE
-        self._state = ElevatorState.IDLE
-        self._target_floors: Set[int] = set()  # Floors this elevator needs to visit
-        self._lock = Lock()  # Thread safety
+        # All mutable state is published together as one snapshot: readers take
+        # the reference without locking (rebinding an attribute is atomic under
+        # the GIL); writers build a new snapshot under the lock
+        self._snapshot = ElevatorSnapshot(1, Direction.IDLE, ElevatorState.IDLE)
+        self._lock = Lock()  # Serializes writers
         
     def get_id(self) -> int:
         return self._id
     
+    def get_min_floor(self) -> int:
+        return self._min_floor
+    
+    def get_max_floor(self) -> int:
+        return self._max_floor
+    
+    def get_snapshot(self) -> ElevatorSnapshot:
+        return self._snapshot
+    
     def get_current_floor(self) -> int:
-        with self._lock:
-            return self._current_floor
+        return self._snapshot.floor
     
     def get_direction(self) -> Direction:
-        with self._lock:
-            return self._direction
+        return self._snapshot.direction
     
     def get_state(self) -> ElevatorState:
-        with self._lock:
-            return self._state
+        return self._snapshot.state
     
     def add_target_floor(self, floor: int) -> bool:
         """Add a target floor for this elevator"""
         if not self._min_floor <= floor <= self._max_floor:
             return False
+        # Repeat presses usually find the floor already targeted; check the
+        # published snapshot first so they never take the writer lock
+        if floor in self._snapshot.targets:
+            return True
         
         with self._lock:
-            self._target_floors.add(floor)
+            snap = self._snapshot
+            if floor not in snap.targets:  # Re-check: another writer may have added it
+                i = bisect_left(snap.sorted_targets, floor)
+                self._snapshot = replace(
+                    snap, targets=snap.targets | {floor},
+                    sorted_targets=snap.sorted_targets[:i] + (floor,) + snap.sorted_targets[i:])
         return True
     
-    def get_target_floors(self) -> Set[int]:
-        with self._lock:
-            return self._target_floors.copy()
+    def get_target_floors(self) -> FrozenSet[int]:
+        """Current targets (immutable, no copy is made)"""
+        return self._snapshot.targets
+    
+    def get_sorted_target_floors(self) -> Tuple[int, ...]:
+        """Current targets in ascending order (immutable, no copy is made)"""
+        return self._snapshot.sorted_targets
     
     def remove_target_floor(self, floor: int) -> None:
         with self._lock:
-            self._target_floors.discard(floor)
+            snap = self._snapshot
+            if floor in snap.targets:
+                i = bisect_left(snap.sorted_targets, floor)
+                self._snapshot = replace(
+                    snap, targets=snap.targets - {floor},
+                    sorted_targets=snap.sorted_targets[:i] + snap.sorted_targets[i + 1:])
     
     def has_target_floors(self) -> bool:
-        with self._lock:
-            return len(self._target_floors) > 0
+        return bool(self._snapshot.targets)
     
     def move_to_next_floor(self) -> None:
         """Move elevator one floor in current direction"""
         with self._lock:
-            if self._direction == Direction.UP:
-                if self._current_floor < self._max_floor:
-                    self._current_floor += 1
-                    self._state = ElevatorState.MOVING
-            elif self._direction == Direction.DOWN:
-                if self._current_floor > self._min_floor:
-                    self._current_floor -= 1
-                    self._state = ElevatorState.MOVING
+            snap = self._snapshot
+            next_floor = snap.floor + snap.step
+            if snap.step and self._min_floor <= next_floor <= self._max_floor:
+                self._snapshot = replace(snap, floor=next_floor,
+                                         state=ElevatorState.MOVING)
     
     def stop_at_floor(self) -> None:
         """Stop elevator at current floor"""
-        with self._lock:
-            self._state = ElevatorState.STOPPED
+        self.set_state(ElevatorState.STOPPED)
     
     def set_direction(self, direction: Direction) -> None:
         with self._lock:
-            self._direction = direction
+            self._snapshot = replace(self._snapshot, direction=direction,
+                                     step=_DIRECTION_STEP[direction])
     
     def set_state(self, state: ElevatorState) -> None:
         with self._lock:
-            self._state = state
+            self._snapshot = replace(self._snapshot, state=state)
     
     def set_idle(self) -> None:
         with self._lock:
-            self._direction = Direction.IDLE
-            self._state = ElevatorState.IDLE
+            self._snapshot = replace(self._snapshot, direction=Direction.IDLE,
+                                     state=ElevatorState.IDLE, step=0)
     
     def is_moving_towards(self, floor: int) -> bool:
         """Check if elevator is moving towards the given floor"""
-        with self._lock:
-            if self._direction == Direction.UP:
-                return floor > self._current_floor
-            elif self._direction == Direction.DOWN:
-                return floor < self._current_floor
-            return False
+        snap = self._snapshot
+        # Same sign as the step means ahead of us; idle (step 0) is never towards
+        return snap.step * (floor - snap.floor) > 0
     
     def __repr__(self) -> str:
-        return (f"Elevator {self._id}: Floor {self._current_floor}, "
-                f"{self._direction.value}, {self._state.value}")
+        snap = self._snapshot
+        return (f"Elevator {self._id}: Floor {snap.floor}, "
+                f"{snap.direction.value}, {snap.state.value}")
 
 
 class Floor:
-    """Represents a building floor"""
+    """Represents a building floor: a view onto the system's button arrays"""
     
-    def __init__(self, floor_number: int):
+    # Button states live in per-building bytearrays indexed by floor number.
+    # A single byte store or load is atomic under the GIL and never
+    # read-modify-written, so no lock is needed
+    
+    __slots__ = ('_floor_number', '_up_buttons', '_down_buttons')
+    
+    def __init__(self, floor_number: int, up_buttons: bytearray, down_buttons: bytearray):
         self._floor_number = floor_number
-        self._up_button_pressed = False
-        self._down_button_pressed = False
-        self._lock = Lock()
+        self._up_buttons = up_buttons
+        self._down_buttons = down_buttons
     
     def get_floor_number(self) -> int:
         return self._floor_number
     
     def press_up_button(self) -> None:
-        with self._lock:
-            self._up_button_pressed = True
+        self._up_buttons[self._floor_number] = 1
     
     def press_down_button(self) -> None:
-        with self._lock:
-            self._down_button_pressed = True
+        self._down_buttons[self._floor_number] = 1
     
     def clear_up_button(self) -> None:
-        with self._lock:
-            self._up_button_pressed = False
+        self._up_buttons[self._floor_number] = 0
     
     def clear_down_button(self) -> None:
-        with self._lock:
-            self._down_button_pressed = False
+        self._down_buttons[self._floor_number] = 0
     
     def is_up_button_pressed(self) -> bool:
-        with self._lock:
-            return self._up_button_pressed
+        return bool(self._up_buttons[self._floor_number])
     
     def is_down_button_pressed(self) -> bool:
-        with self._lock:
-            return self._down_button_pressed
+        return bool(self._down_buttons[self._floor_number])
 
 
 # ==================== Strategy Pattern: Scheduling Algorithms ====================
@@ -185,34 +284,83 @@ class SchedulingStrategy(ABC):
         pass
     
     @abstractmethod
-    def get_next_floor(self, elevator: Elevator) -> Optional[int]:
-        """Determine the next floor for the elevator to visit"""
+    def get_next_floor(self, snapshot: ElevatorSnapshot) -> Optional[int]:
+        """Determine the next floor to visit, from the controller's snapshot of the elevator"""
         pass
 
 
+def _next_floor_in_direction(sorted_targets: Tuple[int, ...], current_floor: int,
+                             step: int) -> Optional[int]:
+    """
+    Nearest target ahead in the current direction (UP when idle), else the
+    nearest one behind. O(log N) via bisect on the ascending targets.
+    """
+    above = bisect_right(sorted_targets, current_floor)  # First target > current
+    below = bisect_left(sorted_targets, current_floor)   # Targets < current end here
+    
+    if step < 0:
+        if below > 0:
+            return sorted_targets[below - 1]  # Next floor going down
+        if above < len(sorted_targets):
+            return sorted_targets[above]  # Reverse: next floor going up
+    else:
+        if above < len(sorted_targets):
+            return sorted_targets[above]  # Next floor going up
+        if below > 0:
+            return sorted_targets[below - 1]  # Reverse: next floor going down
+    return None
+
+
 class FCFSSchedulingStrategy(SchedulingStrategy):
     """First-Come-First-Serve scheduling"""
     
     def select_elevator(self, elevators: List[Elevator], request: Request) -> Optional[Elevator]:
         """Select nearest idle elevator, or any idle elevator"""
-        idle_elevators = [e for e in elevators if e.get_state() == ElevatorState.IDLE]
+        request_floor = request.floor
+        best_elevator = None
+        best_distance = None
         
-        if idle_elevators:
-            # Select nearest idle elevator
-            return min(idle_elevators, 
-                      key=lambda e: abs(e.get_current_floor() - request.floor))
+        # Select nearest idle elevator
+        for elevator in elevators:
+            snap = elevator.get_snapshot()
+            if snap.state is not ElevatorState.IDLE:
+                continue
+            distance = snap.floor - request_floor
+            if distance < 0:
+                distance = -distance
+            if best_distance is None or distance < best_distance:
+                best_distance = distance
+                best_elevator = elevator
+        
+        if best_elevator is not None:
+            return best_elevator
         
         # If no idle elevators, select the one with fewest targets
-        return min(elevators, key=lambda e: len(e.get_target_floors()))
+        fewest_targets = None
+        for elevator in elevators:
+            num_targets = len(elevator.get_snapshot().targets)
+            if fewest_targets is None or num_targets < fewest_targets:
+                fewest_targets = num_targets
+                best_elevator = elevator
+        
+        return best_elevator
     
-    def get_next_floor(self, elevator: Elevator) -> Optional[int]:
+    def get_next_floor(self, snapshot: ElevatorSnapshot) -> Optional[int]:
         """Simply go to the nearest target floor"""
-        target_floors = elevator.get_target_floors()
-        if not target_floors:
+        sorted_targets = snapshot.sorted_targets
+        if not sorted_targets:
             return None
         
-        current_floor = elevator.get_current_floor()
-        return min(target_floors, key=lambda f: abs(f - current_floor))
+        # The nearest target is one of the two neighbours of the current floor
+        current_floor = snapshot.floor
+        i = bisect_left(sorted_targets, current_floor)
+        if i == len(sorted_targets):
+            return sorted_targets[-1]
+        if i == 0:
+            return sorted_targets[0]
+        below, above = sorted_targets[i - 1], sorted_targets[i]
+        # Ties go to the lower floor
+        return below if current_floor - below <= above - current_floor else above
 
 
 class LOOKSchedulingStrategy(SchedulingStrategy):
@@ -220,80 +368,54 @@ class LOOKSchedulingStrategy(SchedulingStrategy):
     
     def select_elevator(self, elevators: List[Elevator], request: Request) -> Optional[Elevator]:
         """Select elevator based on direction and proximity"""
+        # Request fields and the bound scorer are read once, not per elevator
+        request_floor = request.floor
+        request_direction = request.direction
+        calculate_score = self._calculate_score
         best_elevator = None
-        best_score = float('inf')
+        best_score = None
         
         for elevator in elevators:
-            score = self._calculate_score(elevator, request)
-            if score < best_score:
+            score = calculate_score(elevator, request_floor, request_direction)
+            if best_score is None or score < best_score:
                 best_score = score
                 best_elevator = elevator
         
         return best_elevator
     
-    def _calculate_score(self, elevator: Elevator, request: Request) -> float:
+    def _calculate_score(self, elevator: Elevator, request_floor: int,
+                         request_direction: Optional[Direction]) -> int:
         """Calculate a score for how suitable this elevator is for the request"""
-        current_floor = elevator.get_current_floor()
-        direction = elevator.get_direction()
-        request_floor = request.floor
+        snap = elevator.get_snapshot()
+        current_floor = snap.floor
+        step = snap.step
+        offset = request_floor - current_floor
         
         # If elevator is idle, score is just distance
-        if direction == Direction.IDLE:
-            return abs(current_floor - request_floor)
+        if not step:
+            return abs(offset)
         
-        # If elevator is moving in same direction as request
-        if request.direction and direction == request.direction:
-            if direction == Direction.UP and request_floor >= current_floor:
-                return request_floor - current_floor  # Small score if on the way
-            elif direction == Direction.DOWN and request_floor <= current_floor:
-                return current_floor - request_floor
+        # If elevator is moving in same direction as request and it is on the way
+        if request_direction is snap.direction and step * offset >= 0:
+            return step * offset  # Small score if on the way
         
         # Otherwise, elevator needs to finish current direction first
-        target_floors = elevator.get_target_floors()
-        if not target_floors:
-            return abs(current_floor - request_floor)
+        # (extreme targets are the ends of the sorted tuple, no min/max scan)
+        sorted_targets = snap.sorted_targets
+        if not sorted_targets:
+            return abs(offset)
         
-        if direction == Direction.UP:
-            max_target = max(target_floors)
-            return (max_target - current_floor) + (max_target - request_floor)
-        else:
-            min_target = min(target_floors)
-            return (current_floor - min_target) + (request_floor - min_target)
+        # Distance to the furthest target ahead, then back to the request
+        turn_floor = sorted_targets[-1] if step > 0 else sorted_targets[0]
+        return step * (turn_floor - current_floor) + step * (turn_floor - request_floor)
     
-    def get_next_floor(self, elevator: Elevator) -> Optional[int]:
+    def get_next_floor(self, snapshot: ElevatorSnapshot) -> Optional[int]:
         """
         LOOK algorithm: Continue in current direction until no more requests,
         then reverse direction
         """
-        target_floors = elevator.get_target_floors()
-        if not target_floors:
-            return None
-        
-        current_floor = elevator.get_current_floor()
-        direction = elevator.get_direction()
-        
-        # Get floors in current direction
-        if direction == Direction.UP or direction == Direction.IDLE:
-            floors_ahead = [f for f in target_floors if f > current_floor]
-            if floors_ahead:
-                return min(floors_ahead)  # Next floor going up
-            
-            # No floors ahead, reverse direction
-            floors_behind = [f for f in target_floors if f < current_floor]
-            if floors_behind:
-                return max(floors_behind)  # Next floor going down
-        
-        elif direction == Direction.DOWN:
-            floors_ahead = [f for f in target_floors if f < current_floor]
-            if floors_ahead:
-                return max(floors_ahead)  # Next floor going down
-            
-            # No floors ahead, reverse direction
-            floors_behind = [f for f in target_floors if f > current_floor]
-            if floors_behind:
-                return min(floors_behind)  # Next floor going up
-        
-        return None
+        return _next_floor_in_direction(snapshot.sorted_targets, snapshot.floor,
+                                        snapshot.step)
 
 
 class SCANSchedulingStrategy(SchedulingStrategy):
@@ -304,147 +426,115 @@ class SCANSchedulingStrategy(SchedulingStrategy):
     
     def select_elevator(self, elevators: List[Elevator], request: Request) -> Optional[Elevator]:
         """Select elevator similar to LOOK"""
+        # Request fields and the bound scorer are read once, not per elevator
+        request_floor = request.floor
+        request_direction = request.direction
+        calculate_score = self._calculate_score
         best_elevator = None
-        best_score = float('inf')
+        best_score = None
         
         for elevator in elevators:
-            score = self._calculate_score(elevator, request)
-            if score < best_score:
+            score = calculate_score(elevator, request_floor, request_direction)
+            if best_score is None or score < best_score:
                 best_score = score
                 best_elevator = elevator
         
         return best_elevator
     
-    def _calculate_score(self, elevator: Elevator, request: Request) -> float:
+    def _calculate_score(self, elevator: Elevator, request_floor: int,
+                         request_direction: Optional[Direction]) -> int:
         """Calculate score - similar to LOOK"""
-        current_floor = elevator.get_current_floor()
-        direction = elevator.get_direction()
-        request_floor = request.floor
+        snap = elevator.get_snapshot()
+        current_floor = snap.floor
+        step = snap.step
+        offset = request_floor - current_floor
         
-        if direction == Direction.IDLE:
-            return abs(current_floor - request_floor)
+        if not step:
+            return abs(offset)
         
-        if request.direction and direction == request.direction:
-            if direction == Direction.UP and request_floor >= current_floor:
-                return request_floor - current_floor
-            elif direction == Direction.DOWN and request_floor <= current_floor:
-                return current_floor - request_floor
+        if request_direction is snap.direction and step * offset >= 0:
+            return step * offset
         
         # Penalize if elevator needs to go to end first
-        if direction == Direction.UP:
-            return (elevator._max_floor - current_floor) + abs(elevator._max_floor - request_floor)
-        else:
-            return (current_floor - elevator._min_floor) + abs(request_floor - elevator._min_floor)
+        end_floor = elevator.get_max_floor() if step > 0 else elevator.get_min_floor()
+        return step * (end_floor - current_floor) + abs(end_floor - request_floor)
     
-    def get_next_floor(self, elevator: Elevator) -> Optional[int]:
+    def get_next_floor(self, snapshot: ElevatorSnapshot) -> Optional[int]:
         """
         SCAN algorithm: Continue to the end (top/bottom) before reversing
         """
-        target_floors = elevator.get_target_floors()
-        if not target_floors:
-            return None
-        
-        current_floor = elevator.get_current_floor()
-        direction = elevator.get_direction()
-        
-        if direction == Direction.UP or direction == Direction.IDLE:
-            floors_ahead = [f for f in target_floors if f > current_floor]
-            if floors_ahead:
-                return min(floors_ahead)
-            
-            # Reached top, go down
-            floors_behind = [f for f in target_floors if f < current_floor]
-            if floors_behind:
-                return max(floors_behind)
-        
-        elif direction == Direction.DOWN:
-            floors_ahead = [f for f in target_floors if f < current_floor]
-            if floors_ahead:
-                return max(floors_ahead)
-            
-            # Reached bottom, go up
-            floors_behind = [f for f in target_floors if f > current_floor]
-            if floors_behind:
-                return min(floors_behind)
-        
-        return None
+        return _next_floor_in_direction(snapshot.sorted_targets, snapshot.floor,
+                                        snapshot.step)
 
 
 # ==================== Elevator Controller ====================
 
 class ElevatorController:
-    """Controls a single elevator's movement"""
+    """Steps a single elevator; ticked by the ElevatorSystem scheduler thread"""
     
     def __init__(self, elevator: Elevator, scheduling_strategy: SchedulingStrategy):
         self._elevator = elevator
         self._scheduling_strategy = scheduling_strategy
-        self._running = False
-        self._lock = Lock()
+        self._running = False  # Plain bool store, atomic under the GIL
     
     def start(self) -> None:
         """Start the elevator controller"""
-        with self._lock:
-            if self._running:
-                return
-            self._running = True
-        
-        # Run controller in separate thread
-        controller_thread = Thread(target=self._run, daemon=True)
-        controller_thread.start()
+        self._running = True
     
     def stop(self) -> None:
         """Stop the elevator controller"""
-        with self._lock:
-            self._running = False
+        self._running = False
     
-    def _run(self) -> None:
-        """Main controller loop"""
-        while True:
-            with self._lock:
-                if not self._running:
-                    break
-            
-            self._process_next_move()
-            time.sleep(1)  # Simulate time to move one floor
+    def has_work(self) -> bool:
+        return self._running and self._elevator.has_target_floors()
     
-    def _process_next_move(self) -> None:
-        """Process the next move for this elevator"""
-        if not self._elevator.has_target_floors():
+    def tick(self) -> Optional[float]:
+        """Make the next move; seconds until the following one, or None once idle"""
+        snap = self._elevator.get_snapshot()
+        if not self._running or not snap.targets:
             self._elevator.set_idle()
-            return
+            return None
+        
+        # A target on the current floor (e.g. a hall call where an idle car
+        # waits) is served here; the strategies only look above and below
+        if snap.floor in snap.targets:
+            self._elevator.stop_at_floor()
+            self._elevator.remove_target_floor(snap.floor)
+            logger.info("[Elevator %d] Stopped at floor %d", self._elevator.get_id(), snap.floor)
+            return DOOR_OPEN_TIME
         
         # Get next floor to visit
-        next_floor = self._scheduling_strategy.get_next_floor(self._elevator)
+        next_floor = self._scheduling_strategy.get_next_floor(snap)
         
         if next_floor is None:
             self._elevator.set_idle()
-            return
+            return None
         
-        current_floor = self._elevator.get_current_floor()
+        current_floor = snap.floor
         
-        # Determine direction
-        if next_floor > current_floor:
-            self._elevator.set_direction(Direction.UP)
-        elif next_floor < current_floor:
-            self._elevator.set_direction(Direction.DOWN)
+        # Determine direction: +1 up, -1 down, 0 when already at the target
+        step = (next_floor > current_floor) - (next_floor < current_floor)
+        if step:
+            self._elevator.set_direction(_STEP_DIRECTION[step])
         else:
             # Already at target floor
             self._elevator.stop_at_floor()
             self._elevator.remove_target_floor(current_floor)
-            print(f"[Elevator {self._elevator.get_id()}] Stopped at floor {current_floor}")
-            time.sleep(2)  # Door open time
-            return
+            logger.info("[Elevator %d] Stopped at floor %d", self._elevator.get_id(), current_floor)
+            return DOOR_OPEN_TIME
         
         # Move towards next floor
         self._elevator.move_to_next_floor()
-        current_floor = self._elevator.get_current_floor()
+        snap = self._elevator.get_snapshot()
+        current_floor = snap.floor
         
         # Check if we've arrived at a target floor
-        if current_floor in self._elevator.get_target_floors():
+        if current_floor in snap.targets:
             self._elevator.stop_at_floor()
             self._elevator.remove_target_floor(current_floor)
-            print(f"[Elevator {self._elevator.get_id()}] Stopped at floor {current_floor}")
-            time.sleep(2)  # Door open time
+            logger.info("[Elevator %d] Stopped at floor %d", self._elevator.get_id(), current_floor)
+            return DOOR_OPEN_TIME
+        return FLOOR_TRAVEL_TIME
 
 
 # ==================== Elevator System ====================
@@ -457,14 +547,20 @@ class ElevatorSystem:
         self._num_floors = num_floors
         self._elevators: List[Elevator] = []
         self._controllers: List[ElevatorController] = []
-        self._floors: Dict[int, Floor] = {}
+        # Hall buttons per floor (index 0 unused), one byte each instead of
+        # one Floor object per floor; see Floor for the lock-free access
+        self._up_buttons = bytearray(num_floors + 1)
+        self._down_buttons = bytearray(num_floors + 1)
         self._scheduling_strategy = scheduling_strategy
-        self._request_queue: List[Request] = []
+        # Hall calls waiting for the scheduler thread, assigned in batches
+        self._request_queue: Deque[Request] = deque(maxlen=REQUEST_QUEUE_SIZE)
+        self._request_pool = RequestPool(warmup=DISPATCH_BATCH_SIZE)
         self._lock = Lock()
-        
-        # Create floors
-        for i in range(1, num_floors + 1):
-            self._floors[i] = Floor(i)
+        # The scheduler sleeps on this until a deadline, new work, or stop()
+        self._work_available = Condition(self._lock)
+        # Bumped with every notify, so the scheduler can tell new work arrived
+        self._work_generation = 0
+        self._running = False
         
         # Create elevators and controllers
         for i in range(num_elevators):
@@ -476,13 +572,26 @@ class ElevatorSystem:
     def start(self) -> None:
         """Start all elevator controllers"""
         print(f"Starting elevator system with {len(self._elevators)} elevators...")
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
         for controller in self._controllers:
             controller.start()
+        # One thread drives every elevator, whatever the elevator count
+        Thread(target=self._run, daemon=True).start()
     
     def stop(self) -> None:
         """Stop all elevator controllers"""
         for controller in self._controllers:
             controller.stop()
+        with self._work_available:
+            self._running = False
+            self._work_available.notify_all()
+            pending = list(self._request_queue)
+            self._request_queue.clear()
+        # Calls the scheduler never reached are still assigned, as before stop()
+        self._dispatch_batch(pending)
     
     def request_elevator(self, floor: int, direction: Direction) -> None:
         """Request elevator from a floor (hall call)"""
@@ -491,21 +600,31 @@ class ElevatorSystem:
             return
         
         # Press button on floor
-        floor_obj = self._floors[floor]
         if direction == Direction.UP:
-            floor_obj.press_up_button()
+            self._up_buttons[floor] = 1
         else:
-            floor_obj.press_down_button()
+            self._down_buttons[floor] = 1
         
-        request = Request(
+        request = self._request_pool.claim(
             floor=floor,
             direction=direction,
             request_type=RequestType.HALL_CALL,
             timestamp=time.time()
         )
         
-        self._handle_request(request)
-        print(f"[System] Hall call: Floor {floor}, {direction.value}")
+        # Queue for the scheduler; a burst of calls is assigned in one pass.
+        # Before start(), after stop() or with the queue full, the call is
+        # assigned right here instead
+        with self._work_available:
+            queued = self._running and len(self._request_queue) < REQUEST_QUEUE_SIZE
+            if queued:
+                self._request_queue.append(request)
+                self._work_generation += 1
+                self._work_available.notify()
+        if not queued:
+            self._dispatch_batch([request])
+            self._notify_work()
+        logger.info("[System] Hall call: Floor %d, %s", floor, direction.value)
     
     def request_floor(self, elevator_id: int, target_floor: int) -> None:
         """Request a floor from inside elevator (car call)"""
@@ -519,8 +638,79 @@ class ElevatorSystem:
         
         elevator = self._elevators[elevator_id - 1]
         elevator.add_target_floor(target_floor)
+        self._notify_work()
+        
+        logger.info("[System] Car call: Elevator %d -> Floor %d", elevator_id, target_floor)
+    
+    def _run(self) -> None:
+        """
+        Scheduler thread: assign queued hall calls and tick each busy elevator
+        at its deadline, taken from a heap of (deadline, controller index)
+        """
+        heap: List[Tuple[float, int]] = []
+        scheduled: Set[int] = set()  # Controllers currently in the heap
+        # Controllers that went idle with targets they could not reach; left
+        # alone until new work is signalled, so they are not re-ticked in a spin
+        parked: Set[int] = set()
+        generation = -1
         
-        print(f"[System] Car call: Elevator {elevator_id} -> Floor {target_floor}")
+        while True:
+            with self._work_available:
+                # Sleep until the earliest deadline, new work, or stop()
+                while (self._running and not self._request_queue and
+                       generation == self._work_generation and
+                       not self._has_unscheduled_work(scheduled, parked)):
+                    timeout = heap[0][0] - time.monotonic() if heap else None
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._work_available.wait(timeout)
+                if not self._running:
+                    return
+                if generation != self._work_generation:
+                    generation = self._work_generation
+                    parked.clear()
+                batch = self._take_pending_batch()
+            
+            self._dispatch_batch(batch)
+            
+            now = time.monotonic()
+            for index, controller in enumerate(self._controllers):
+                if index not in scheduled and index not in parked and controller.has_work():
+                    scheduled.add(index)
+                    heapq.heappush(heap, (now, index))
+            
+            while heap and heap[0][0] <= now:
+                deadline, index = heapq.heappop(heap)
+                controller = self._controllers[index]
+                delay = controller.tick()
+                if delay is None:
+                    scheduled.discard(index)
+                    if controller.has_work():
+                        parked.add(index)
+                else:
+                    # Next deadline counts from the last one, so pacing never drifts
+                    heapq.heappush(heap, (deadline + delay, index))
+    
+    def _has_unscheduled_work(self, scheduled: Set[int], parked: Set[int]) -> bool:
+        return any(index not in scheduled and index not in parked and controller.has_work()
+                   for index, controller in enumerate(self._controllers))
+    
+    def _take_pending_batch(self) -> List[Request]:
+        """Pop up to DISPATCH_BATCH_SIZE queued hall calls (caller holds self._lock)"""
+        return [self._request_queue.popleft()
+                for _ in range(min(len(self._request_queue), DISPATCH_BATCH_SIZE))]
+    
+    def _dispatch_batch(self, batch: List[Request]) -> None:
+        """Assign a batch of hall calls to elevators"""
+        # Repeated presses of the same button only need one assignment
+        seen = set()
+        for request in batch:
+            key = (request.floor, request.direction)
+            if key not in seen:
+                seen.add(key)
+                self._handle_request(request)
+            # Strategies never keep the request, so it can be reused right away
+            self._request_pool.release(request)
     
     def _handle_request(self, request: Request) -> None:
         """Handle an elevator request"""
@@ -529,9 +719,15 @@ class ElevatorSystem:
         
         if elevator:
             elevator.add_target_floor(request.floor)
-            print(f"[System] Assigned Elevator {elevator.get_id()} to request")
+            logger.info("[System] Assigned Elevator %d to request", elevator.get_id())
         else:
-            print(f"[System] No available elevator for request")
+            logger.info("[System] No available elevator for request")
+    
+    def _notify_work(self) -> None:
+        """Wake the scheduler after a target floor was added"""
+        with self._work_available:
+            self._work_generation += 1
+            self._work_available.notify_all()
     
     def display_status(self) -> None:
         """Display current status of all elevators"""
@@ -539,13 +735,19 @@ class ElevatorSystem:
         print("ELEVATOR SYSTEM STATUS")
         print("="*60)
         for elevator in self._elevators:
-            targets = sorted(elevator.get_target_floors())
-            targets_str = f"Targets: {targets}" if targets else "No targets"
+            # Targets are kept sorted on the snapshot, so no per-print sort
+            targets = elevator.get_sorted_target_floors()
+            targets_str = f"Targets: {list(targets)}" if targets else "No targets"
             print(f"{elevator} | {targets_str}")
         print("="*60 + "\n")
     
     def get_elevators(self) -> List[Elevator]:
         return self._elevators
+    
+    def get_floor(self, floor: int) -> Floor:
+        if not 1 <= floor <= self._num_floors:
+            raise Exception(f"Invalid floor: {floor}")
+        return Floor(floor, self._up_buttons, self._down_buttons)
 
 
 # ==================== Factory Pattern ====================
@@ -645,7 +847,8 @@ if __name__ == "__main__":
 # Controller Pattern:
 
 # ElevatorController manages individual elevator movement
-# Runs in separate thread for each elevator
+# Owns no thread: the system's single scheduler thread calls its tick(), one
+# move per call (see Single Scheduler Thread below)
 # Decouples movement logic from elevator state
 
 
@@ -658,25 +861,49 @@ if __name__ == "__main__":
 
 # Concurrency Handling:
 
-# Thread Locks (Lock):
+# Copy-on-Write Snapshots:
 
-# Every shared state access is protected
-# Elevator uses locks for current floor, direction, targets
-# Floor uses locks for button states
+# Only writers take a lock: each Elevator's lock serializes updates, which
+# build a new immutable ElevatorSnapshot and publish it with one reference store
+# Readers (controllers, strategies, display) take no lock; they load the current
+# snapshot once and work from it, so a read never blocks a move
+# Floor button states are lock-free byte stores in two per-building bytearrays
+# (atomic under the GIL); Floor is a thin view onto them
 # ElevatorSystem uses locks for request queue
-
-
-# Thread-per-Controller:
-
-# Each elevator runs in its own thread
-# Allows concurrent elevator movement
-# Controllers coordinate through shared ElevatorSystem
+# Hall calls are queued and assigned in batches by the scheduler thread
+# (duplicate presses in a batch are assigned once)
+# The queue holds at most REQUEST_QUEUE_SIZE calls; when it is full, or the
+# scheduler is not running, the caller assigns its own call synchronously
+
+
+# Single Scheduler Thread:
+
+# One ElevatorSystem thread drives every elevator through a heap of
+# (deadline, controller) entries; each controller tick() is one move and
+# returns the delay until its next one (travel or door time)
+# Deadlines count from the previous deadline, so pacing does not drift
+# A floor of travel takes FLOOR_TRAVEL_TIME (1.0s); a stop takes DOOR_OPEN_TIME
+# (2.0s) in total, where the old per-elevator loop slept 2s and then waited
+# for its next 1s tick
+# Idle elevators leave the heap; the thread sleeps on a Condition until the
+# next deadline, a new target or hall call, or stop() (which is immediate)
+# Movement and dispatch messages are logged through a QueueHandler; one listener
+# thread (started at import) writes them, so the scheduler never contends on
+# stdout; invalid-floor/elevator errors are printed directly, as the caller's
+# own feedback
+# The heap loop already gives coroutine-like cost per elevator (one heap entry,
+# no stack), so asyncio would add nothing but an async-only public API;
+# request_elevator/request_floor stay plain calls usable from any thread
 
 
 # Atomic Operations:
 
-# All state reads/writes are atomic with lock protection
-# Prevents race conditions when multiple elevators access same data
+# Each write replaces the whole snapshot under the elevator's lock, so
+# concurrent writers never lose an update
+# Floor, direction and state are read lock-free from one immutable ElevatorSnapshot,
+# so a reader always sees a consistent triple from a single instant
+# Target floors live in the same snapshot (frozenset + sorted tuple), so floor,
+# direction and targets are always read from one consistent instant
 
 
 
@@ -706,7 +933,7 @@ if __name__ == "__main__":
 # ✅ Multiple Elevators: Independent operation, coordinated by system
 # ✅ Request Types: Hall calls (from floors) vs Car calls (from inside)
 # ✅ Direction Management: UP, DOWN, IDLE states
-# ✅ Thread Safety: All shared state protected by locks
+# ✅ Thread Safety: Locked writers, lock-free reads of immutable snapshots
 # ✅ Real-time Processing: Controllers run continuously in background
 # ✅ Pluggable Scheduling: Easy to add new algorithms
 # Extensions You Could Add:
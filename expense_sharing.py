@@ -1,12 +1,28 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List, Optional, Dict, Set
+from typing import List, Optional, Dict, Set, Tuple, Sequence, Mapping
+from types import MappingProxyType
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from collections import defaultdict
+from functools import lru_cache
 from threading import Lock
-import heapq
+import itertools
+
+
+# BalanceSheet spreads users over this many independently locked shards
+BALANCE_SHARDS = 16
+
+# Settlements among at most this many people (with non-zero balances) are split
+# into zero-sum groups exactly; the subset search is O(2^n * n)
+EXACT_SETTLEMENT_MAX_USERS = 15
+
+# Settlement plans remembered by SettlementOptimizer, keyed by the net balances
+SETTLEMENT_CACHE_SIZE = 256
+
+# Percentage/share templates (e.g. fixed roommate ratios) kept pre-scaled
+SPLIT_WEIGHTS_CACHE_SIZE = 1024
 
 
 # ==================== Enums ====================
@@ -38,11 +54,40 @@ class TransactionStatus(Enum):
     CANCELLED = "CANCELLED"
 
 
+# ==================== Money ====================
+
+# Amounts are kept as integer cents inside splits, balances and settlement;
+# Decimal is only used at the API edges (expense totals, payments) and for display
+
+def _to_cents(amount) -> int:
+    """Convert a Decimal/int/float amount to integer cents (half-up)"""
+    if type(amount) is int:
+        # Whole amounts, percentages and share counts: no Decimal needed
+        return amount * 100
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))  # Via str() so floats convert as written
+    return int((amount * 100).to_integral_value(ROUND_HALF_UP))
+
+
+def _from_cents(cents: int) -> Decimal:
+    """Convert integer cents to a 2-place Decimal"""
+    return Decimal(cents).scaleb(-2)
+
+
+def _format_cents(cents: int) -> str:
+    """Format cents as dollars ("$12.05", "-$0.50") with int math, no Decimal"""
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}${dollars}.{cents:02d}"
+
+
 # ==================== Core Models ====================
 
 class User:
     """Represents a user in the system"""
     
+    __slots__ = ('_user_id', '_name', '_email', '_phone')
+    
     def __init__(self, user_id: str, name: str, email: str, phone: str):
         self._user_id = user_id
         self._name = name
@@ -70,11 +115,16 @@ class User:
         return self._user_id == other._user_id
 
 
-@dataclass
+@dataclass(slots=True)
 class Split:
     """Represents how much a user owes/is owed in an expense"""
     user: User
-    amount: Decimal
+    amount_cents: int
+    
+    @property
+    def amount(self) -> Decimal:
+        """Amount as a Decimal, for display"""
+        return _from_cents(self.amount_cents)
     
     def __repr__(self) -> str:
         return f"Split({self.user.get_name()}: ${self.amount})"
@@ -86,18 +136,18 @@ class SplitStrategy(ABC):
     """Abstract strategy for splitting expenses"""
     
     @abstractmethod
-    def calculate_splits(self, total_amount: Decimal, 
+    def calculate_splits(self, total_cents: int, 
                         paid_by: User,
                         participants: List[User],
                         metadata: Dict) -> List[Split]:
         """
-        Calculate how much each participant owes.
+        Calculate how many cents each participant owes.
         Returns list of splits (can be negative for the payer).
         """
         pass
     
     @abstractmethod
-    def validate(self, total_amount: Decimal, metadata: Dict) -> bool:
+    def validate(self, total_cents: int, metadata: Dict) -> bool:
         """Validate split parameters"""
         pass
 
@@ -105,7 +155,7 @@ class SplitStrategy(ABC):
 class EqualSplitStrategy(SplitStrategy):
     """Split equally among all participants"""
     
-    def calculate_splits(self, total_amount: Decimal, 
+    def calculate_splits(self, total_cents: int, 
                         paid_by: User,
                         participants: List[User],
                         metadata: Dict) -> List[Split]:
@@ -113,66 +163,84 @@ class EqualSplitStrategy(SplitStrategy):
         if not participants:
             return []
         
-        # Calculate per-person amount
-        per_person = total_amount / len(participants)
+        # Calculate per-person amount; the first `remainder` participants pay
+        # one extra cent so the shares add up to the total exactly
+        per_person, remainder = divmod(total_cents, len(participants))
         
         splits = []
-        for user in participants:
+        for i, user in enumerate(participants):
+            share = per_person + 1 if i < remainder else per_person
             if user == paid_by:
                 # Payer receives (total - their share)
-                splits.append(Split(user, -(total_amount - per_person)))
+                splits.append(Split(user, -(total_cents - share)))
             else:
                 # Others owe their share
-                splits.append(Split(user, per_person))
+                splits.append(Split(user, share))
         
         return splits
     
-    def validate(self, total_amount: Decimal, metadata: Dict) -> bool:
-        return total_amount > 0
+    def validate(self, total_cents: int, metadata: Dict) -> bool:
+        return total_cents > 0
+
+
+@lru_cache(maxsize=SPLIT_WEIGHTS_CACHE_SIZE)
+def _scaled_weights(items: Tuple[tuple, ...]) -> Tuple[Mapping[str, int], int, Decimal]:
+    """
+    User id -> weight scaled x100 by _to_cents, the scaled total and the exact
+    (unrounded) total, for one percentages/shares template; reused templates
+    skip the conversions.
+    """
+    scaled = {user_id: _to_cents(value) for user_id, value in items}
+    exact_total = sum((Decimal(str(value)) for _, value in items), Decimal(0))
+    return MappingProxyType(scaled), sum(scaled.values()), exact_total
+
+
+def _weighted_splits(total_cents: int, paid_by: User, participants: List[User],
+                     weights: Mapping[str, int], denominator: int) -> List[Split]:
+    """
+    Each non-payer owes total * weight / denominator cents (rounded down),
+    where weights maps user id -> scaled weight (see _scaled_weights).
+    Built in one comprehension pass with the lookups bound outside the loop.
+    """
+    get_weight = weights.get
+    splits = [Split(user, total_cents * get_weight(user.get_id(), 0) // denominator)
+              for user in participants if user != paid_by]
+    
+    # Payer receives what the others owe (and absorbs rounded-down cents)
+    splits.append(Split(paid_by, -sum(split.amount_cents for split in splits)))
+    
+    return splits
 
 
 class PercentageSplitStrategy(SplitStrategy):
     """Split by percentage"""
     
-    def calculate_splits(self, total_amount: Decimal, 
+    def calculate_splits(self, total_cents: int, 
                         paid_by: User,
                         participants: List[User],
                         metadata: Dict) -> List[Split]:
         
-        percentages = metadata.get('percentages', {})
-        
-        splits = []
-        payer_share = Decimal('0')
-        
-        for user in participants:
-            percentage = Decimal(str(percentages.get(user.get_id(), 0)))
-            user_amount = (total_amount * percentage) / Decimal('100')
-            
-            if user == paid_by:
-                payer_share = user_amount
-            else:
-                splits.append(Split(user, user_amount))
-        
-        # Payer receives (total - their share)
-        splits.append(Split(paid_by, -(total_amount - payer_share)))
-        
-        return splits
+        # Percent -> basis points (the same x100 scaling as cents)
+        basis_points, _, _ = _scaled_weights(tuple(metadata.get('percentages', {}).items()))
+        return _weighted_splits(total_cents, paid_by, participants, basis_points, 10000)
     
-    def validate(self, total_amount: Decimal, metadata: Dict) -> bool:
-        if total_amount <= 0:
+    def validate(self, total_cents: int, metadata: Dict) -> bool:
+        if total_cents <= 0:
             return False
         
-        percentages = metadata.get('percentages', {})
-        total_percentage = sum(Decimal(str(p)) for p in percentages.values())
+        _, _, total_percentage = _scaled_weights(
+            tuple(metadata.get('percentages', {}).items()))
         
-        # Check if percentages sum to 100
-        return abs(total_percentage - Decimal('100')) < Decimal('0.01')
+        # Check if percentages sum to 100, within a hundredth of a percent: a
+        # three-way 33.333/33.333/33.334 split is valid even though each share
+        # rounds to 3333 basis points (the payer absorbs the missing cents)
+        return abs(total_percentage - 100) < Decimal('0.01')
 
 
 class ExactSplitStrategy(SplitStrategy):
     """Split by exact amounts"""
     
-    def calculate_splits(self, total_amount: Decimal, 
+    def calculate_splits(self, total_cents: int, 
                         paid_by: User,
                         participants: List[User],
                         metadata: Dict) -> List[Split]:
@@ -180,79 +248,86 @@ class ExactSplitStrategy(SplitStrategy):
         exact_amounts = metadata.get('exact_amounts', {})
         
         splits = []
-        payer_share = Decimal('0')
+        payer_share = 0
         
         for user in participants:
-            user_amount = Decimal(str(exact_amounts.get(user.get_id(), 0)))
+            user_cents = _to_cents(exact_amounts.get(user.get_id(), 0))
             
             if user == paid_by:
-                payer_share = user_amount
+                payer_share = user_cents
             else:
-                splits.append(Split(user, user_amount))
+                splits.append(Split(user, user_cents))
         
         # Payer receives (total - their share)
-        splits.append(Split(paid_by, -(total_amount - payer_share)))
+        splits.append(Split(paid_by, -(total_cents - payer_share)))
         
         return splits
     
-    def validate(self, total_amount: Decimal, metadata: Dict) -> bool:
-        if total_amount <= 0:
+    def validate(self, total_cents: int, metadata: Dict) -> bool:
+        if total_cents <= 0:
             return False
         
         exact_amounts = metadata.get('exact_amounts', {})
-        total_splits = sum(Decimal(str(a)) for a in exact_amounts.values())
+        total_splits = sum((Decimal(str(a)) for a in exact_amounts.values()), Decimal(0))
         
-        # Check if amounts sum to total
-        return abs(total_splits - total_amount) < Decimal('0.01')
+        # Check if amounts sum to total, within a cent: 33.333/33.333/33.334
+        # is valid even though each amount rounds to 33.33 (the payer absorbs
+        # the difference)
+        return abs(total_splits - _from_cents(total_cents)) < Decimal('0.01')
 
 
 class SharesSplitStrategy(SplitStrategy):
     """Split by shares/units (e.g., one person ordered 2 items, another 1)"""
     
-    def calculate_splits(self, total_amount: Decimal, 
+    def calculate_splits(self, total_cents: int, 
                         paid_by: User,
                         participants: List[User],
                         metadata: Dict) -> List[Split]:
         
-        shares = metadata.get('shares', {})
-        total_shares = sum(shares.values())
+        # Hundredths of a share, so fractional shares stay in integer math
+        shares, total_shares, _ = _scaled_weights(tuple(metadata.get('shares', {}).items()))
         
         if total_shares == 0:
             return []
         
-        per_share = total_amount / Decimal(str(total_shares))
-        
-        splits = []
-        payer_share = Decimal('0')
-        
-        for user in participants:
-            user_shares = Decimal(str(shares.get(user.get_id(), 0)))
-            user_amount = per_share * user_shares
-            
-            if user == paid_by:
-                payer_share = user_amount
-            else:
-                splits.append(Split(user, user_amount))
-        
-        # Payer receives (total - their share)
-        splits.append(Split(paid_by, -(total_amount - payer_share)))
-        
-        return splits
+        return _weighted_splits(total_cents, paid_by, participants, shares, total_shares)
     
-    def validate(self, total_amount: Decimal, metadata: Dict) -> bool:
-        if total_amount <= 0:
+    def validate(self, total_cents: int, metadata: Dict) -> bool:
+        if total_cents <= 0:
             return False
         
         shares = metadata.get('shares', {})
         return sum(shares.values()) > 0
 
 
+# Strategies are stateless: pass these shared instances instead of
+# constructing one per expense (also looked up by split type)
+EQUAL_SPLIT = EqualSplitStrategy()
+PERCENTAGE_SPLIT = PercentageSplitStrategy()
+EXACT_SPLIT = ExactSplitStrategy()
+SHARES_SPLIT = SharesSplitStrategy()
+
+STRATEGY_BY_TYPE: Dict[SplitType, SplitStrategy] = {
+    SplitType.EQUAL: EQUAL_SPLIT,
+    SplitType.PERCENTAGE: PERCENTAGE_SPLIT,
+    SplitType.EXACT: EXACT_SPLIT,
+    SplitType.SHARES: SHARES_SPLIT,
+}
+
+
 # ==================== Expense ====================
 
 class Expense:
     """Represents a shared expense"""
     
-    _expense_counter = 0
+    # Many expenses are kept for history; skip the per-instance __dict__
+    __slots__ = ('_expense_id', '_description', '_total_amount', '_total_cents',
+                 '_paid_by', '_category', '_split_strategy', '_participants',
+                 '_metadata', '_created_at', '_splits', '_owed_users', '_owed_cents')
+    
+    # next() on itertools.count is a single C call, so concurrent expenses
+    # never draw the same id (a read-add-store on a class int could)
+    _expense_counter = itertools.count(1)
     
     def __init__(self, description: str, total_amount: Decimal,
                  paid_by: User, category: ExpenseCategory,
@@ -260,10 +335,10 @@ class Expense:
                  participants: List[User],
                  metadata: Optional[Dict] = None):
         
-        Expense._expense_counter += 1
-        self._expense_id = f"EXP-{Expense._expense_counter:08d}"
+        self._expense_id = f"EXP-{next(Expense._expense_counter):08d}"
         self._description = description
         self._total_amount = total_amount
+        self._total_cents = _to_cents(total_amount)
         self._paid_by = paid_by
         self._category = category
         self._split_strategy = split_strategy
@@ -271,21 +346,28 @@ class Expense:
         self._metadata = metadata or {}
         self._created_at = datetime.now()
         self._splits: List[Split] = []
+        # Parallel columns of the positive splits (who owes the payer, and how
+        # many cents), filled once alongside _splits
+        self._owed_users: Tuple[User, ...] = ()
+        self._owed_cents: Tuple[int, ...] = ()
         
         # Calculate splits
         self._calculate_splits()
     
     def _calculate_splits(self) -> None:
         """Calculate splits using the strategy"""
-        if not self._split_strategy.validate(self._total_amount, self._metadata):
+        if not self._split_strategy.validate(self._total_cents, self._metadata):
             raise ValueError("Invalid split configuration")
         
         self._splits = self._split_strategy.calculate_splits(
-            self._total_amount,
+            self._total_cents,
             self._paid_by,
             self._participants,
             self._metadata
         )
+        owed = [split for split in self._splits if split.amount_cents > 0]
+        self._owed_users = tuple(split.user for split in owed)
+        self._owed_cents = tuple(split.amount_cents for split in owed)
     
     def get_id(self) -> str:
         return self._expense_id
@@ -296,6 +378,9 @@ class Expense:
     def get_total_amount(self) -> Decimal:
         return self._total_amount
     
+    def get_total_cents(self) -> int:
+        return self._total_cents
+    
     def get_paid_by(self) -> User:
         return self._paid_by
     
@@ -305,6 +390,10 @@ class Expense:
     def get_participants(self) -> List[User]:
         return self._participants
     
+    def get_owed_cents(self) -> Tuple[Tuple[User, ...], Tuple[int, ...]]:
+        """Users who owe the payer and the cents each owes, as parallel tuples"""
+        return self._owed_users, self._owed_cents
+    
     def get_splits(self) -> List[Split]:
         return self._splits
     
@@ -320,15 +409,17 @@ class Expense:
 class Group:
     """Represents a group of users who share expenses"""
     
-    _group_counter = 0
+    _group_counter = itertools.count(1)  # Atomic id source, as in Expense
     
     def __init__(self, name: str, created_by: User, description: str = ""):
-        Group._group_counter += 1
-        self._group_id = f"GRP-{Group._group_counter:06d}"
+        self._group_id = f"GRP-{next(Group._group_counter):06d}"
         self._name = name
         self._description = description
         self._created_by = created_by
         self._members: Set[User] = {created_by}
+        # Copy-on-write view of the members in join order; rebuilt under the lock
+        # on every change, read without it (rebinding is atomic under the GIL)
+        self._members_snapshot: Tuple[User, ...] = (created_by,)
         self._expenses: List[Expense] = []
         self._lock = Lock()
     
@@ -344,6 +435,7 @@ class Group:
             if user in self._members:
                 return False
             self._members.add(user)
+            self._members_snapshot = self._members_snapshot + (user,)
             return True
     
     def remove_member(self, user: User) -> bool:
@@ -357,17 +449,23 @@ class Group:
                 return False
             
             self._members.remove(user)
+            self._members_snapshot = tuple(m for m in self._members_snapshot if m != user)
             return True
     
-    def get_members(self) -> List[User]:
-        with self._lock:
-            return list(self._members)
+    def get_members(self) -> Tuple[User, ...]:
+        """Current members (immutable, no copy is made)"""
+        return self._members_snapshot
     
     def add_expense(self, expense: Expense) -> None:
         """Add an expense to the group"""
         with self._lock:
             self._expenses.append(expense)
     
+    def add_expenses(self, expenses: List[Expense]) -> None:
+        """Add many expenses to the group under one lock acquisition"""
+        with self._lock:
+            self._expenses.extend(expenses)
+    
     def get_expenses(self) -> List[Expense]:
         with self._lock:
             return self._expenses.copy()
@@ -379,103 +477,252 @@ class Group:
 # ==================== Balance Sheet ====================
 
 
+class _BalanceShard:
+    """Debts and net totals of the users whose ids map to one shard"""
+    
+    def __init__(self):
+        self.lock = Lock()
+        # edges[(id_a, id_b)] = cents that user id_a owes to user id_b (flat: one
+        # probe per lookup, no inner dict per debtor); only non-zero edges kept
+        self.edges: Dict[Tuple[int, int], int] = {}
+        # net[id_a] = cents user id_a owes in total minus cents owed to them
+        self.net: Dict[int, int] = defaultdict(int)
+        # Bumped before and after every change to edges (odd while a write is
+        # in progress); lets readers skip the lock and reuse derived results
+        self.version = 0
+
+
 class BalanceSheet:
     """Manages balances between users"""
     
     def __init__(self):
-        # balance[user_a][user_b] = amount that user_a owes to user_b
-        self._balances: Dict[User, Dict[User, Decimal]] = defaultdict(lambda: defaultdict(Decimal))
-        self._lock = Lock()
+        # Users are interned to small int ids on first use; edges and nets are
+        # keyed by id, so lookups hash ints instead of calling User.__hash__
+        self._user_ids: Dict[User, int] = {}
+        self._users: List[User] = []
+        self._intern_lock = Lock()
+        # A user's debts (edges from them) and net total live in shard
+        # id % BALANCE_SHARDS; writes lock only the shards of the users
+        # involved, so expenses between disjoint users proceed in parallel
+        self._shards = [_BalanceShard() for _ in range(BALANCE_SHARDS)]
+        # Last get_simplified_balances() result and the shard versions it was
+        # computed at; both only touched while every shard lock is held
+        self._simplified_cache: Optional[Mapping[tuple, int]] = None
+        self._simplified_versions: Optional[Tuple[int, ...]] = None
+    
+    def _intern(self, user: User) -> int:
+        """Id of user, assigning the next free one the first time it is seen"""
+        user_id = self._user_ids.get(user)
+        if user_id is None:
+            with self._intern_lock:
+                user_id = self._user_ids.get(user)
+                if user_id is None:
+                    user_id = len(self._users)
+                    # Listed before the id is published, so readers that find
+                    # the id can always map it back
+                    self._users.append(user)
+                    self._user_ids[user] = user_id
+        return user_id
+    
+    def _shard(self, user_id: int) -> _BalanceShard:
+        return self._shards[user_id % BALANCE_SHARDS]
+    
+    def _lock_shards(self, user_ids) -> List[Lock]:
+        """Acquire the shard locks for user ids in shard order (deadlock-free)"""
+        indices = sorted({user_id % BALANCE_SHARDS for user_id in user_ids})
+        locks = [self._shards[i].lock for i in indices]
+        for lock in locks:
+            lock.acquire()
+        return locks
+    
+    def _lock_all_shards(self) -> List[Lock]:
+        locks = [shard.lock for shard in self._shards]
+        for lock in locks:
+            lock.acquire()
+        return locks
+    
+    @staticmethod
+    def _unlock(locks: List[Lock]) -> None:
+        for lock in reversed(locks):
+            lock.release()
+    
+    def _owes(self, id1: int, id2: int) -> int:
+        """Cents user id1 owes user id2 (caller holds id1's shard lock)"""
+        return self._shard(id1).edges.get((id1, id2), 0)
     
     def add_expense(self, expense: Expense) -> None:
         """Update balances based on an expense"""
-        with self._lock:
-            for split in expense.get_splits():
-                user = split.user
-                amount = split.amount
-                
-                if amount > 0:
+        self.apply_expenses([expense])
+    
+    def apply_expenses(self, expenses: List[Expense]) -> None:
+        """Update balances for many expenses, locking the shards involved once"""
+        # Only positive splits change anything: each is owed to its payer.
+        # Every user is interned once here; the loops below only see ids
+        intern = self._intern
+        owed = []
+        for expense in expenses:
+            users, cents = expense.get_owed_cents()
+            owed.append((intern(expense.get_paid_by()),
+                         [intern(user) for user in users], cents))
+        involved = {payer for payer, _, _ in owed}
+        for _, user_ids, _ in owed:
+            involved.update(user_ids)
+        
+        # Shards whose edges change: their versions stay odd for the whole batch
+        changed = {self._shard(user_id) for _, user_ids, _ in owed for user_id in user_ids}
+        
+        locks = self._lock_shards(involved)
+        for shard in changed:
+            shard.version += 1
+        try:
+            for payer, user_ids, cents in owed:
+                for user_id, amount in zip(user_ids, cents):
                     # User owes this amount to the payer
-                    payer = expense.get_paid_by()
-                    self._balances[user][payer] += amount
-                elif amount < 0:
-                    # User is owed (they are the payer)
-                    # This is handled by the positive amounts of others
-                    pass
-    
-    def _get_balance_internal(self, user1: User, user2: User) -> Decimal:
-        """Internal method - assumes lock is already held"""
-        owes = self._balances[user1][user2]
-        owed = self._balances[user2][user1]
+                    shard = self._shard(user_id)
+                    edge = (user_id, payer)
+                    shard.edges[edge] = shard.edges.get(edge, 0) + amount
+                    shard.net[user_id] += amount
+                # The payer is owed the column total
+                self._shard(payer).net[payer] -= sum(cents)
+        finally:
+            for shard in changed:
+                shard.version += 1
+            self._unlock(locks)
+    
+    def _get_balance_internal(self, id1: int, id2: int) -> int:
+        """Internal method - assumes both users' shard locks are held"""
+        owes = self._owes(id1, id2)
+        owed = self._owes(id2, id1)
         return owes - owed
     
-    def get_balance(self, user1: User, user2: User) -> Decimal:
-        """Get net balance between two users (positive = user1 owes user2)"""
-        with self._lock:
-            return self._get_balance_internal(user1, user2)
-    
-    def get_all_balances(self, user: User) -> Dict[User, Decimal]:
-        """Get all balances for a user"""
-        with self._lock:
-            balances = {}
-            
-            # What user owes to others
-            for other, amount in self._balances[user].items():
-                net = amount - self._balances[other][user]
-                if abs(net) > Decimal('0.01'):
-                    balances[other] = net
+    def get_balance(self, user1: User, user2: User) -> int:
+        """Get net balance in cents between two users (positive = user1 owes user2)"""
+        id1 = self._user_ids.get(user1)
+        id2 = self._user_ids.get(user2)
+        if id1 is None or id2 is None:
+            # Never part of an expense or payment here
+            return 0
+        
+        # Optimistic lock-free read: valid if neither shard was mid-write and
+        # neither version moved while the two edges were read
+        shard1 = self._shard(id1)
+        shard2 = self._shard(id2)
+        version1 = shard1.version
+        version2 = shard2.version
+        if version1 % 2 == 0 and version2 % 2 == 0:
+            balance = shard1.edges.get((id1, id2), 0) - shard2.edges.get((id2, id1), 0)
+            if shard1.version == version1 and shard2.version == version2:
+                return balance
+        
+        # A write overlapped; read again under the shard locks
+        locks = self._lock_shards((id1, id2))
+        try:
+            return self._get_balance_internal(id1, id2)
+        finally:
+            self._unlock(locks)
+    
+    def get_all_balances(self, user: User) -> Dict[User, int]:
+        """Get all balances for a user, in cents"""
+        user_id = self._user_ids.get(user)
+        if user_id is None:
+            return {}
+        
+        # Who owes this user can be in any shard
+        locks = self._lock_all_shards()
+        try:
+            balances: Dict[int, int] = {}
             
-            # What others owe to user (not already counted)
-            for other in self._balances:
-                if other != user and other not in balances:
-                    net = self._balances[user][other] - self._balances[other][user]
-                    if abs(net) > Decimal('0.01'):
-                        balances[other] = net
+            # One pass over the edges: add what user owes, subtract what is owed
+            for shard in self._shards:
+                for (debtor, creditor), amount in shard.edges.items():
+                    if debtor == user_id:
+                        balances[creditor] = balances.get(creditor, 0) + amount
+                    elif creditor == user_id:
+                        balances[debtor] = balances.get(debtor, 0) - amount
             
-            return balances
+            users = self._users
+            return {users[other]: net for other, net in balances.items() if net}
+        finally:
+            self._unlock(locks)
     
-    def get_simplified_balances(self) -> Dict[tuple, Decimal]:
-        """Get all non-zero balances in simplified form"""
-        with self._lock:
+    def get_simplified_balances(self) -> Mapping[tuple, int]:
+        """
+        Get all non-zero balances in simplified form, in cents. Read-only:
+        reused until an expense or payment changes a balance.
+        """
+        locks = self._lock_all_shards()
+        try:
+            versions = tuple(shard.version for shard in self._shards)
+            if versions == self._simplified_versions:
+                return self._simplified_cache
+            
+            users = self._users
             simplified = {}
             processed = set()
             
-            for user1 in self._balances:
-                for user2 in self._balances[user1]:
-                    if (user1, user2) in processed or (user2, user1) in processed:
+            for shard in self._shards:
+                for (id1, id2), owes in shard.edges.items():
+                    # Each edge appears once; skip pairs netted from the other side
+                    if (id2, id1) in processed:
                         continue
+                    processed.add((id1, id2))
                     
-                    net = self._balances[user1][user2] - self._balances[user2][user1]
+                    net = owes - self._owes(id2, id1)
                     
-                    if abs(net) > Decimal('0.01'):
+                    if net:
                         if net > 0:
-                            simplified[(user1, user2)] = net
+                            simplified[(users[id1], users[id2])] = net
                         else:
-                            simplified[(user2, user1)] = -net
-                    
-                    processed.add((user1, user2))
-                    processed.add((user2, user1))
+                            simplified[(users[id2], users[id1])] = -net
             
-            return simplified
-    
-    def settle_balance(self, from_user: User, to_user: User, amount: Decimal) -> bool:
-        """Record a settlement payment"""
-        with self._lock:
+            self._simplified_cache = MappingProxyType(simplified)
+            self._simplified_versions = versions
+            return self._simplified_cache
+        finally:
+            self._unlock(locks)
+    
+    def get_net_balances(self) -> Dict[User, int]:
+        """Net cents per user (positive = owes overall, negative = is owed)"""
+        locks = self._lock_all_shards()
+        try:
+            users = self._users
+            return {users[user_id]: net
+                    for shard in self._shards
+                    for user_id, net in shard.net.items()}
+        finally:
+            self._unlock(locks)
+    
+    def settle_balance(self, from_user: User, to_user: User, amount_cents: int) -> bool:
+        """Record a settlement payment of amount_cents"""
+        from_id = self._intern(from_user)
+        to_id = self._intern(to_user)
+        
+        locks = self._lock_shards((from_id, to_id))
+        try:
             # Use internal method to avoid deadlock
-            current_balance = self._get_balance_internal(from_user, to_user)
+            current_balance = self._get_balance_internal(from_id, to_id)
             
-            if amount > current_balance + Decimal('0.01'):
+            if amount_cents > current_balance:
                 print(f"Settlement amount exceeds balance")
                 return False
             
-            self._balances[from_user][to_user] -= amount
+            from_shard = self._shard(from_id)
+            edge = (from_id, to_id)
+            remaining = from_shard.edges.get(edge, 0) - amount_cents
+            from_shard.version += 1
+            from_shard.net[from_id] -= amount_cents
+            self._shard(to_id).net[to_id] += amount_cents
             
             # Clean up zero balances
-            if abs(self._balances[from_user][to_user]) < Decimal('0.01'):
-                if from_user in self._balances and to_user in self._balances[from_user]:
-                    del self._balances[from_user][to_user]
+            if remaining:
+                from_shard.edges[edge] = remaining
+            else:
+                from_shard.edges.pop(edge, None)
+            from_shard.version += 1
             
             return True
+        finally:
+            self._unlock(locks)
 
 # ==================== Settlement Optimizer ====================
 
@@ -484,59 +731,212 @@ class SettlementOptimizer:
     
     @staticmethod
     def minimize_transactions(balance_sheet: BalanceSheet, 
-                            users: List[User]) -> List[tuple]:
+                            users: Sequence[User]) -> List[tuple]:
         """
         Calculate minimum transactions needed to settle all debts.
-        Uses greedy algorithm with heaps.
-        Returns list of (from_user, to_user, amount) tuples.
+        Splits users into zero-sum groups first (a group of k people needs
+        k - 1 payments, so every extra group saves one), then settles each
+        group with greedy largest-first matching (sort + two pointers).
+        Returns list of (from_user, to_user, amount_cents) tuples.
         """
         
-        # Calculate net balance for each user
+        # Two people settle their direct balance: one payment at most, and it
+        # can always be recorded with settle_balance
+        if len(users) < 2:
+            return []
+        if len(users) == 2:
+            user1, user2 = users
+            balance = balance_sheet.get_balance(user1, user2)
+            if balance > 0:
+                return [(user1, user2, balance)]
+            if balance < 0:
+                return [(user2, user1, -balance)]
+            return []
+        
+        # Net balance for each user, maintained incrementally by the sheet
+        all_nets = balance_sheet.get_net_balances()
         net_balances = {}
         for user in users:
-            balances = balance_sheet.get_all_balances(user)
-            net = sum(balances.values())
-            if abs(net) > Decimal('0.01'):
+            net = all_nets.get(user, 0)
+            if net:
                 net_balances[user] = net
         
         if not net_balances:
             return []
         
-        # Separate debtors (owe money) and creditors (are owed money)
-        debtors = []   # Max heap (negative values)
-        creditors = [] # Max heap (negative values for max heap behavior)
+        # The plan depends only on who owes what, so the same nets (e.g. a
+        # frozen trip viewed repeatedly) are answered from the cache. It is
+        # keyed by user id, not User, so it holds no app's users and every
+        # caller gets the plan mapped back onto its own User objects
+        by_id = {user.get_id(): user for user in net_balances}
+        plan = SettlementOptimizer._plan(
+            tuple((user.get_id(), net) for user, net in net_balances.items()))
+        return [(by_id[debtor], by_id[creditor], amount)
+                for debtor, creditor, amount in plan]
+    
+    @staticmethod
+    @lru_cache(maxsize=SETTLEMENT_CACHE_SIZE)
+    def _plan(net_items: Tuple[Tuple[str, int], ...]) -> Tuple[Tuple[str, str, int], ...]:
+        """Settlement transactions (by user id) for the given (user id, non-zero net) pairs"""
+        net_balances = dict(net_items)
+        transactions = []
         
-        for user, balance in net_balances.items():
-            if balance > 0:
-                # User owes money
-                heapq.heappush(debtors, (-balance, user))
-            elif balance < 0:
-                # User is owed money
-                heapq.heappush(creditors, (balance, user))  # Already negative
+        for group in SettlementOptimizer._extract_zero_sum_subsets(net_balances):
+            # Separate debtors (owe money) and creditors (are owed money); the
+            # matching itself only sees integer amounts and list indices
+            debtors: List[str] = []
+            debts: List[int] = []
+            creditors: List[str] = []
+            credits: List[int] = []
+            
+            for user in group:
+                balance = net_balances[user]
+                if balance > 0:
+                    # User owes money
+                    debtors.append(user)
+                    debts.append(balance)
+                else:
+                    # User is owed money
+                    creditors.append(user)
+                    credits.append(-balance)
+            
+            transactions.extend(
+                (debtors[d], creditors[c], amount)
+                for d, c, amount in SettlementOptimizer._minimize_core(debts, credits))
+        
+        return tuple(transactions)
+    
+    @staticmethod
+    def _extract_zero_sum_subsets(net: Dict[str, int]) -> List[List[str]]:
+        """
+        Partition users into as many zero-sum groups as possible. Exact for up
+        to EXACT_SETTLEMENT_MAX_USERS people, pair/triple matching beyond that.
+        One group may be left over that does not sum to zero (when settling a
+        subset of users who also owe people outside it).
+        """
+        users = list(net)
+        amounts = [net[user] for user in users]
+        
+        if len(users) <= EXACT_SETTLEMENT_MAX_USERS:
+            groups = SettlementOptimizer._zero_sum_groups_exact(amounts)
+        else:
+            groups = SettlementOptimizer._zero_sum_groups_small(amounts)
+        
+        return [[users[i] for i in group] for group in groups]
+    
+    @staticmethod
+    def _zero_sum_groups_exact(amounts: List[int]) -> List[List[int]]:
+        """
+        Bitmask DP: best[mask] is the most zero-sum groups the people in mask
+        can be cut into. Ordering people so that every group is a run, that is
+        the most prefixes of the order summing to zero; last[mask] records who
+        comes last in the best order of mask.
+        """
+        full = (1 << len(amounts)) - 1
+        sums = [0] * (full + 1)
+        best = [0] * (full + 1)
+        last = [0] * (full + 1)
+        
+        for mask in range(1, full + 1):
+            low = mask & -mask
+            sums[mask] = sums[mask ^ low] + amounts[low.bit_length() - 1]
+            
+            top = -1
+            rest = mask
+            while rest:
+                bit = rest & -rest
+                rest ^= bit
+                if best[mask ^ bit] > top:
+                    top = best[mask ^ bit]
+                    last[mask] = bit.bit_length() - 1
+            best[mask] = top + (sums[mask] == 0)
+        
+        # Walk the best order backwards, closing a group at each zero prefix
+        groups = []
+        group = []
+        mask = full
+        while mask:
+            if sums[mask] == 0 and group:
+                groups.append(group)
+                group = []
+            i = last[mask]
+            group.append(i)
+            mask ^= 1 << i
+        groups.append(group)
+        
+        return groups
+    
+    @staticmethod
+    def _zero_sum_groups_small(amounts: List[int]) -> List[List[int]]:
+        """
+        Greedy fallback for large inputs: take matching pairs (x, -x), then
+        zero-sum triples; everyone else forms the last group. O(n^2).
+        """
+        positions: Dict[int, List[int]] = defaultdict(list)
+        for i, amount in enumerate(amounts):
+            positions[amount].append(i)
+        unused = set(range(len(amounts)))
+        groups = []
+        
+        # Pairs: one person owes exactly what another is owed
+        for i in range(len(amounts)):
+            if i not in unused:
+                continue
+            for k in positions.get(-amounts[i], ()):
+                if k in unused and k != i:
+                    unused -= {i, k}
+                    groups.append([i, k])
+                    break
+        
+        # Triples: two people's balances cancel a third's
+        for i in range(len(amounts)):
+            for j in range(i + 1, len(amounts)):
+                if i not in unused or j not in unused:
+                    continue
+                for k in positions.get(-(amounts[i] + amounts[j]), ()):
+                    if k in unused and k != i and k != j:
+                        unused -= {i, j, k}
+                        groups.append([i, j, k])
+                        break
+        
+        if unused:
+            groups.append(sorted(unused))
+        
+        return groups
+    
+    @staticmethod
+    def _minimize_core(debts: List[int], credits: List[int]) -> List[Tuple[int, int, int]]:
+        """
+        Greedy matching over plain ints: returns (debtor_index, creditor_index,
+        cents) triples. Each step exhausts at least one side, so one sort and
+        a two-pointer walk replace the heap pops and re-pushes.
+        """
+        # Largest first; sort() is stable, so ties keep their input order
+        debtors = sorted(range(len(debts)), key=debts.__getitem__, reverse=True)
+        creditors = sorted(range(len(credits)), key=credits.__getitem__, reverse=True)
+        remaining_debts = list(debts)
+        remaining_credits = list(credits)
         
         transactions = []
+        i = j = 0
         
         # Match largest debtor with largest creditor
-        while debtors and creditors:
-            debt_amount, debtor = heapq.heappop(debtors)
-            credit_amount, creditor = heapq.heappop(creditors)
-            
-            debt_amount = -debt_amount  # Convert back to positive
-            credit_amount = -credit_amount  # Convert back to positive
+        while i < len(debtors) and j < len(creditors):
+            debtor = debtors[i]
+            creditor = creditors[j]
             
             # Settle minimum of debt and credit
-            settlement = min(debt_amount, credit_amount)
+            settlement = min(remaining_debts[debtor], remaining_credits[creditor])
             transactions.append((debtor, creditor, settlement))
             
-            # Push back remainder if any
-            remaining_debt = debt_amount - settlement
-            remaining_credit = credit_amount - settlement
-            
-            if remaining_debt > Decimal('0.01'):
-                heapq.heappush(debtors, (-remaining_debt, debtor))
+            remaining_debts[debtor] -= settlement
+            remaining_credits[creditor] -= settlement
             
-            if remaining_credit > Decimal('0.01'):
-                heapq.heappush(creditors, (-remaining_credit, creditor))
+            # Move past whichever side is now settled (possibly both)
+            if remaining_debts[debtor] == 0:
+                i += 1
+            if remaining_credits[creditor] == 0:
+                j += 1
         
         return transactions
 
@@ -550,7 +950,9 @@ class ExpenseSharingApp:
         self._users: Dict[str, User] = {}
         self._groups: Dict[str, Group] = {}
         self._balance_sheet = BalanceSheet()
-        self._all_expenses: List[Expense] = []
+        self._all_expenses: List[Expense] = []  # In the order they were added
+        # Each user's expenses in the order added, for per-user history
+        self._expenses_by_user: Dict[User, List[Expense]] = defaultdict(list)
         self._lock = Lock()
     
     def register_user(self, user: User) -> None:
@@ -582,6 +984,7 @@ class ExpenseSharingApp:
         """Add an expense"""
         with self._lock:
             self._all_expenses.append(expense)
+            self._index_expense(expense)
         
         # Update balance sheet
         self._balance_sheet.add_expense(expense)
@@ -594,9 +997,31 @@ class ExpenseSharingApp:
         print(f"Split details:")
         for split in expense.get_splits():
             if split.amount > 0:
-                print(f"  {split.user.get_name()} owes ${split.amount}")
+                print(f"  {split.user.get_name()} owes {_format_cents(split.amount_cents)}")
             else:
-                print(f"  {split.user.get_name()} paid (gets back ${-split.amount})")
+                print(f"  {split.user.get_name()} paid (gets back {_format_cents(-split.amount_cents)})")
+    
+    def _index_expense(self, expense: Expense) -> None:
+        """Record expense under each participant (caller holds self._lock)"""
+        for user in dict.fromkeys(expense.get_participants()):
+            self._expenses_by_user[user].append(expense)
+    
+    def add_expenses_bulk(self, expenses: List[Expense],
+                          group: Optional[Group] = None) -> None:
+        """Add many expenses at once (e.g. an import), taking each lock once"""
+        with self._lock:
+            self._all_expenses.extend(expenses)
+            for expense in expenses:
+                self._index_expense(expense)
+        
+        # Update balance sheet
+        self._balance_sheet.apply_expenses(expenses)
+        
+        # Add to group if specified
+        if group:
+            group.add_expenses(expenses)
+        
+        print(f"\nAdded {len(expenses)} expense(s)")
     
     def show_balance(self, user: User) -> None:
         """Show balance summary for a user"""
@@ -609,29 +1034,29 @@ class ExpenseSharingApp:
         if not balances:
             print("All settled up!")
         else:
-            owes_total = Decimal('0')
-            owed_total = Decimal('0')
+            owes_total = 0
+            owed_total = 0
             
             print("\nYou owe:")
             for other, amount in balances.items():
                 if amount > 0:
-                    print(f"  {other.get_name()}: ${amount:.2f}")
+                    print(f"  {other.get_name()}: {_format_cents(amount)}")
                     owes_total += amount
             
             print("\nYou are owed:")
             for other, amount in balances.items():
                 if amount < 0:
-                    print(f"  {other.get_name()}: ${-amount:.2f}")
+                    print(f"  {other.get_name()}: {_format_cents(-amount)}")
                     owed_total += -amount
             
             print(f"\n{'-'*60}")
-            print(f"Total you owe: ${owes_total:.2f}")
-            print(f"Total owed to you: ${owed_total:.2f}")
+            print(f"Total you owe: {_format_cents(owes_total)}")
+            print(f"Total owed to you: {_format_cents(owed_total)}")
             net = owed_total - owes_total
             if net > 0:
-                print(f"Net: You are owed ${net:.2f}")
+                print(f"Net: You are owed {_format_cents(net)}")
             elif net < 0:
-                print(f"Net: You owe ${-net:.2f}")
+                print(f"Net: You owe {_format_cents(-net)}")
             else:
                 print(f"Net: All settled!")
         
@@ -656,7 +1081,7 @@ class ExpenseSharingApp:
             print("All settled up!")
         else:
             for user1, user2, amount in group_balances:
-                print(f"{user1.get_name()} owes {user2.get_name()}: ${amount:.2f}")
+                print(f"{user1.get_name()} owes {user2.get_name()}: {_format_cents(amount)}")
         
         print(f"{'='*60}\n")
     
@@ -673,9 +1098,12 @@ class ExpenseSharingApp:
         elif not users:
             users = list(self._users.values())
         
-        transactions = SettlementOptimizer.minimize_transactions(
+        # Settle in cents; hand back Decimal amounts for record_payment
+        cent_transactions = SettlementOptimizer.minimize_transactions(
             self._balance_sheet, users
         )
+        transactions = [(from_user, to_user, _from_cents(amount))
+                        for from_user, to_user, amount in cent_transactions]
         
         print(f"\n{'='*60}")
         print(f"Optimal Settlement Plan")
@@ -685,8 +1113,8 @@ class ExpenseSharingApp:
             print("All settled up!")
         else:
             print(f"Minimum {len(transactions)} transaction(s) needed:\n")
-            for i, (from_user, to_user, amount) in enumerate(transactions, 1):
-                print(f"{i}. {from_user.get_name()} pays {to_user.get_name()}: ${amount:.2f}")
+            for i, (from_user, to_user, amount) in enumerate(cent_transactions, 1):
+                print(f"{i}. {from_user.get_name()} pays {to_user.get_name()}: {_format_cents(amount)}")
         
         print(f"{'='*60}\n")
         
@@ -695,10 +1123,11 @@ class ExpenseSharingApp:
     def record_payment(self, from_user: User, to_user: User, 
                       amount: Decimal) -> bool:
         """Record a settlement payment"""
-        success = self._balance_sheet.settle_balance(from_user, to_user, amount)
+        amount_cents = _to_cents(amount)
+        success = self._balance_sheet.settle_balance(from_user, to_user, amount_cents)
         
         if success:
-            print(f"\n{from_user.get_name()} paid {to_user.get_name()} ${amount:.2f}")
+            print(f"\n{from_user.get_name()} paid {to_user.get_name()} {_format_cents(amount_cents)}")
             print("Balance updated!")
         
         return success
@@ -710,20 +1139,23 @@ class ExpenseSharingApp:
         print("Expense History")
         print(f"{'='*60}")
         
+        # Every list is kept in the order expenses were added, so newest first
+        # is a reverse walk rather than a sort
         if group:
             expenses = group.get_expenses()
         elif user:
-            expenses = [e for e in self._all_expenses if user in e.get_participants()]
+            with self._lock:
+                expenses = list(self._expenses_by_user.get(user, ()))
         else:
             expenses = self._all_expenses
         
         if not expenses:
             print("No expenses found")
         else:
-            for expense in sorted(expenses, key=lambda e: e.get_created_at(), reverse=True):
+            for expense in reversed(expenses):
                 date = expense.get_created_at().strftime("%Y-%m-%d %H:%M")
                 print(f"\n[{date}] {expense.get_description()}")
-                print(f"  Total: ${expense.get_total_amount()}")
+                print(f"  Total: {_format_cents(expense.get_total_cents())}")
                 print(f"  Paid by: {expense.get_paid_by().get_name()}")
                 print(f"  Category: {expense.get_category().value}")
                 print(f"  Participants: {', '.join(u.get_name() for u in expense.get_participants())}")
@@ -767,7 +1199,7 @@ def main():
         total_amount=Decimal('120.00'),
         paid_by=alice,
         category=ExpenseCategory.FOOD,
-        split_strategy=EqualSplitStrategy(),
+        split_strategy=EQUAL_SPLIT,
         participants=[alice, bob, charlie, diana]
     )
     app.add_expense(expense1, trip_group)
@@ -783,7 +1215,7 @@ def main():
         total_amount=Decimal('200.00'),
         paid_by=bob,
         category=ExpenseCategory.RENT,
-        split_strategy=PercentageSplitStrategy(),
+        split_strategy=PERCENTAGE_SPLIT,
         participants=[alice, bob, charlie, diana],
         metadata={
             'percentages': {
@@ -807,7 +1239,7 @@ def main():
         total_amount=Decimal('85.00'),
         paid_by=charlie,
         category=ExpenseCategory.TRANSPORT,
-        split_strategy=ExactSplitStrategy(),
+        split_strategy=EXACT_SPLIT,
         participants=[alice, bob, charlie, diana],
         metadata={
             'exact_amounts': {
@@ -831,7 +1263,7 @@ def main():
         total_amount=Decimal('60.00'),
         paid_by=diana,
         category=ExpenseCategory.GROCERIES,
-        split_strategy=SharesSplitStrategy(),
+        split_strategy=SHARES_SPLIT,
         participants=[alice, bob, charlie, diana],
         metadata={
             'shares': {
@@ -890,7 +1322,7 @@ def main():
         total_amount=Decimal('40.00'),
         paid_by=alice,
         category=ExpenseCategory.FOOD,
-        split_strategy=EqualSplitStrategy(),
+        split_strategy=EQUAL_SPLIT,
         participants=[alice, bob]
     )
     app.add_expense(expense5)
@@ -917,9 +1349,13 @@ if __name__ == "__main__":
 #    - `PercentageSplitStrategy`: Split by percentage
 #    - `ExactSplitStrategy`: Specify exact amounts
 #    - `SharesSplitStrategy`: Split by shares/units
+#    - Stateless, so each is a shared instance (`EQUAL_SPLIT`, ...,
+#      `STRATEGY_BY_TYPE[SplitType]`)
+#    - ABC only costs at instantiation, which the shared instances do once;
+#      validate() is a single O(n) int sum, cheaper than building a cache key
 
 # 2. **Graph Algorithm** - Settlement optimization:
-#    - Uses greedy algorithm with heaps
+#    - Uses greedy largest-first matching (sort + two pointers)
 #    - Minimizes number of transactions
 #    - Balances debts optimally
 
@@ -977,14 +1413,20 @@ if __name__ == "__main__":
 #    - Positive: owes money (debtor)
 #    - Negative: is owed money (creditor)
 
-# 2. Use two max heaps:
-#    - Debtors heap: people who owe money
-#    - Creditors heap: people who are owed
+# 1b. Split people into as many zero-sum groups as possible:
+#    - A group of k people settles in k - 1 payments
+#    - Exact bitmask DP up to EXACT_SETTLEMENT_MAX_USERS people,
+#      pairs/triples beyond that
+#    - Steps 2-4 run on each group separately
+
+# 2. Sort both sides, largest first:
+#    - Debtors: people who owe money
+#    - Creditors: people who are owed
 
-# 3. Match largest debtor with largest creditor:
+# 3. Match current debtor with current creditor:
 #    - Settlement = min(debt, credit)
 #    - Create transaction
-#    - Push remainder back to heap
+#    - Advance past whichever side is now settled
 
 # 4. Repeat until all debts settled
 # ```
@@ -1035,8 +1477,10 @@ if __name__ == "__main__":
 
 # Thread Locks:
 
-# Group: Protects members and expenses
-# BalanceSheet: Protects balance updates
+# Group: Protects members and expenses (members are also published as an
+# immutable tuple, so get_members() reads without the lock)
+# BalanceSheet: Lock-striped; each shard owns some users' rows and nets, and
+# writers lock only the shards of the users they touch (in shard order)
 # ExpenseSharingApp: Protects shared state
 
 
@@ -1045,19 +1489,29 @@ if __name__ == "__main__":
 # Data Structures:
 # Balance Sheet:
 
-# Dict[User, Dict[User, Decimal]]: O(1) balance lookup
-# Nested dictionaries for efficient debt tracking
+# Dict[(debtor_id, creditor_id), int] of cents, split over BALANCE_SHARDS shards
+# Users are interned to int ids once per expense; ids map back to User on output
+# Flat edge map: O(1) balance lookup with one probe, no inner dict per debtor
+# get_balance reads lock-free and validates against the shard versions (odd
+# while a write is in progress), taking the locks only if a write overlapped
 
 # Settlement Optimization:
 
-# heapq: O(log n) heap operations
-# Two heaps for debtors and creditors
+# One sort per side, then an O(n) two-pointer walk
+# Each step settles at least one person, so at most n - 1 transactions
+# Plans are memoized by (user id, net) pairs (LRU, SETTLEMENT_CACHE_SIZE entries), so
+# re-viewing an unchanged group skips the grouping and matching entirely
 
 # Complexity:
 
 # Add expense: O(n) where n = participants
 # Get balance: O(1) lookup
-# Settlement optimization: O(n log n) where n = users
+# Settlement optimization, n = users with a non-zero net balance:
+#   - Zero-sum grouping: O(2^n * n) exact bitmask DP up to
+#     EXACT_SETTLEMENT_MAX_USERS people, O(n^2) pair/triple matching beyond
+#   - Matching each group: O(k log k) sort + two-pointer walk
+#   - Repeat calls with the same nets are answered from the plan cache
+# (net balance per user is kept incrementally, so no O(n^2) pairwise scan)
 
 # Advanced Features:
 # Net Balance Calculation:
@@ -1065,7 +1519,7 @@ if __name__ == "__main__":
 # # Net: Alice owes Bob $20 (simplified)
 # Simplified Balances:
 # python# Only show non-zero net balances
-# # Ignore small amounts (< $0.01) due to rounding
+# # Amounts are integer cents, so zero is exact: no rounding threshold needed
 # ```
 
 # **Group vs Individual**:
@@ -1105,9 +1559,13 @@ if __name__ == "__main__":
 
 # Precision:
 
-# Using Decimal for accurate money calculations
-# Avoids floating-point errors
-# Rounds to 2 decimal places
+# Splits, balances and settlements are integer cents (exact, no rounding drift)
+# Decimal only at the edges: expense totals, payments and display
+# Leftover cents go to the first participants (equal) or the payer (percentage/shares)
+# Percentage/share templates are scaled to integers once and cached
+# (SPLIT_WEIGHTS_CACHE_SIZE), so recurring ratios skip the conversions
+# Each expense also keeps its positive splits as parallel user/cents tuples,
+# which BalanceSheet.apply_expenses walks without touching Split objects
 
 # Example Workflow:
 # python# 1. Create users and group
@@ -1,47 +1,79 @@
+import sys
 from abc import ABC, abstractmethod
 
 
 class Product(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def operation(self):
         pass
 
 
 class ProductOne(Product):
+    __slots__ = ()
+
     def operation(self):
         return "From Product One"
     
 
 class ProductTwo(Product):
+    __slots__ = ()
+
     def operation(self):
         return "From Product Two"
+
+
+# Products are stateless, so every creator call can share one instance
+_PRODUCT_ONE = ProductOne()
+_PRODUCT_TWO = ProductTwo()
     
 
 class Creator(ABC):
+    __slots__ = ()
+
+    # Set to False in subclasses whose factory_method has side effects
+    _cacheable = True
+
     @abstractmethod
     def factory_method(self):
         pass
 
     def perform_operation(self):
+        # A cacheable creator always produces the same string: build it on the
+        # first call and keep it on that class (subclasses get their own)
+        cls = type(self)
+        if cls._cacheable:
+            result = cls.__dict__.get("_result")
+            if result is None:
+                result = cls._result = self._build_result()
+            return result
+        return self._build_result()
+
+    def _build_result(self):
         product = self.factory_method()
         result = product.operation()
         return f"Creator: {result}"
 
 
 class CreatorOne(Creator):
+    __slots__ = ()
+
     def factory_method(self):
-        return ProductOne()
+        return _PRODUCT_ONE
     
 
 class CreatorTwo(Creator):
+    __slots__ = ()
+
     def factory_method(self):
-        return ProductTwo()
+        return _PRODUCT_TWO
     
 
 def client_code(creator):
-    print(creator.perform_operation())
+    return creator.perform_operation()
 
 
 if __name__ == "__main__":
-    client_code(CreatorOne())
-    client_code(CreatorTwo())
+    # Collect the results and write them out once instead of printing each
+    sys.stdout.write("\n".join(client_code(c) for c in (CreatorOne(), CreatorTwo())) + "\n")
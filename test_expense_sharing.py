@@ -0,0 +1,48 @@
+from decimal import Decimal
+
+import pytest
+
+from expense_sharing import (EXACT_SPLIT, Expense, ExpenseCategory, User)
+
+
+def _users():
+    return [User(f"U{i}", f"User {i}", f"user{i}@example.com", "555-0100")
+            for i in range(1, 4)]
+
+
+@pytest.mark.parametrize("total, amounts, expected_cents", [
+    (Decimal('100'), ('33.333', '33.333', '33.334'), [3333, 3333, -6667]),
+    (Decimal('10.00'), ('3.335', '3.335', '3.33'), [334, 333, -666]),
+])
+def test_exact_split_accepts_sub_cent_amounts(total, amounts, expected_cents):
+    users = _users()
+    expense = Expense(
+        description="Dinner",
+        total_amount=total,
+        paid_by=users[0],
+        category=ExpenseCategory.FOOD,
+        split_strategy=EXACT_SPLIT,
+        participants=users,
+        metadata={'exact_amounts': {user.get_id(): Decimal(amount)
+                                    for user, amount in zip(users, amounts)}}
+    )
+
+    # Each amount rounds to whole cents; the payer is owed the total minus
+    # their own share
+    assert [split.amount_cents for split in expense.get_splits()] == expected_cents
+
+
+def test_exact_split_rejects_amounts_off_by_a_cent():
+    users = _users()
+    with pytest.raises(ValueError):
+        Expense(
+            description="Dinner",
+            total_amount=Decimal('100'),
+            paid_by=users[0],
+            category=ExpenseCategory.FOOD,
+            split_strategy=EXACT_SPLIT,
+            participants=users,
+            metadata={'exact_amounts': {'U1': Decimal('33.33'),
+                                        'U2': Decimal('33.33'),
+                                        'U3': Decimal('33.33')}}
+        )